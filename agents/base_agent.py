@@ -7,10 +7,12 @@ and restrictions for different agent types in the GENXAIS framework.
 
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, List, Any, Optional
-from pydantic import BaseModel
+from typing import Dict, List, Any, Optional, Mapping, FrozenSet, Tuple
+from dataclasses import dataclass
+from types import MappingProxyType
 import logging
 from contextlib import contextmanager
+from functools import lru_cache
 
 class AgentMode(str, Enum):
     """Defines the different operational modes for agents."""
@@ -20,12 +22,181 @@ class AgentMode(str, Enum):
     IMPLEMENT = "implement"
     REVIEW = "review"
 
-class AgentRestrictions(BaseModel):
-    """Defines the restrictions and permissions for an agent."""
-    allowed_actions: List[str]
-    forbidden_actions: List[str]
-    required_outputs: List[str]
-    quality_thresholds: Dict[str, float]
+@dataclass(frozen=True, slots=True)
+class AgentRestrictions:
+    """Defines the restrictions and permissions for an agent.
+    
+    Instances are immutable and shared between all agents of a mode, so the
+    collections are normalized to read-only types on construction.
+    """
+    allowed_actions: FrozenSet[str]
+    forbidden_actions: FrozenSet[str]
+    required_outputs: Tuple[str, ...]
+    quality_thresholds: Mapping[str, float]
+    
+    def __post_init__(self):
+        object.__setattr__(self, "allowed_actions", frozenset(self.allowed_actions))
+        object.__setattr__(self, "forbidden_actions", frozenset(self.forbidden_actions))
+        object.__setattr__(self, "required_outputs", tuple(self.required_outputs))
+        object.__setattr__(
+            self, "quality_thresholds", MappingProxyType(dict(self.quality_thresholds))
+        )
+
+# Restriction sets are fixed per mode, so they are built once at import time
+# instead of on every agent construction. The literals below are trusted
+# internal data; AgentRestrictions only normalizes them, no validation runs.
+_MODE_RESTRICTIONS: Dict[AgentMode, AgentRestrictions] = {
+    AgentMode.VAN: AgentRestrictions(
+        allowed_actions=[
+            "read_system_data",
+            "analyze_metrics",
+            "validate_requirements",
+            "generate_reports"
+        ],
+        forbidden_actions=[
+            "modify_code",
+            "create_designs",
+            "make_implementation_decisions",
+            "deploy_code"
+        ],
+        required_outputs=[
+            "analysis_report",
+            "validation_results",
+            "metric_dashboard"
+        ],
+        quality_thresholds={
+            "analysis_coverage": 0.8,
+            "validation_accuracy": 0.9,
+            "report_quality": 0.85
+        }
+    ),
+    AgentMode.PLAN: AgentRestrictions(
+        allowed_actions=[
+            "create_plans",
+            "define_requirements",
+            "allocate_resources",
+            "set_milestones"
+        ],
+        forbidden_actions=[
+            "modify_code",
+            "execute_plans",
+            "modify_systems",
+            "deploy_changes"
+        ],
+        required_outputs=[
+            "project_plan",
+            "resource_allocation",
+            "technical_requirements"
+        ],
+        quality_thresholds={
+            "plan_completeness": 0.9,
+            "requirement_clarity": 0.85,
+            "resource_efficiency": 0.8
+        }
+    ),
+    AgentMode.CREATE: AgentRestrictions(
+        allowed_actions=[
+            "generate_code",
+            "design_architecture",
+            "create_specifications",
+            "develop_schemas"
+        ],
+        forbidden_actions=[
+            "deploy_code",
+            "modify_production",
+            "change_requirements",
+            "execute_code"
+        ],
+        required_outputs=[
+            "source_code",
+            "technical_specs",
+            "architecture_design"
+        ],
+        quality_thresholds={
+            "code_quality": 0.85,
+            "design_completeness": 0.9,
+            "spec_clarity": 0.8
+        }
+    ),
+    AgentMode.IMPLEMENT: AgentRestrictions(
+        allowed_actions=[
+            "deploy_code",
+            "integrate_components",
+            "configure_systems",
+            "run_tests"
+        ],
+        forbidden_actions=[
+            "modify_requirements",
+            "change_architecture",
+            "create_designs",
+            "exceed_scope"
+        ],
+        required_outputs=[
+            "deployment_report",
+            "test_results",
+            "integration_status"
+        ],
+        quality_thresholds={
+            "deployment_success": 0.95,
+            "test_coverage": 0.9,
+            "integration_quality": 0.85
+        }
+    ),
+    AgentMode.REVIEW: AgentRestrictions(
+        allowed_actions=[
+            "review_code",
+            "assess_quality",
+            "identify_issues",
+            "provide_feedback"
+        ],
+        forbidden_actions=[
+            "modify_code",
+            "implement_fixes",
+            "change_designs",
+            "deploy_changes"
+        ],
+        required_outputs=[
+            "review_report",
+            "quality_assessment",
+            "improvement_suggestions"
+        ],
+        quality_thresholds={
+            "review_coverage": 0.9,
+            "assessment_accuracy": 0.85,
+            "feedback_quality": 0.8
+        }
+    ),
+}
+
+# Effective allowed actions per mode (allowed minus forbidden), so that
+# validate_action is a single hashed membership test.
+_ALLOWED_ACTIONS: Dict[AgentMode, frozenset] = {
+    mode: restrictions.allowed_actions - restrictions.forbidden_actions
+    for mode, restrictions in _MODE_RESTRICTIONS.items()
+}
+
+# Quality thresholds per mode as (metric, threshold) pairs for cheap iteration
+_QUALITY_THRESHOLDS: Dict[AgentMode, Tuple[Tuple[str, float], ...]] = {
+    mode: tuple(restrictions.quality_thresholds.items())
+    for mode, restrictions in _MODE_RESTRICTIONS.items()
+}
+
+@lru_cache(maxsize=None)
+def _restrictions_for(mode: AgentMode) -> AgentRestrictions:
+    """Resolve the (shared, cached) restrictions for a mode."""
+    try:
+        return _MODE_RESTRICTIONS[AgentMode(mode)]
+    except (KeyError, ValueError):
+        raise ValueError(f"Unknown mode: {mode}")
+
+# Mode-specific recovery actions for ValueError
+_VALUE_ERROR_ACTIONS: Dict[AgentMode, str] = {
+    AgentMode.VAN: "validated_inputs",
+    AgentMode.PLAN: "adjusted_plan",
+    AgentMode.CREATE: "corrected_parameters",
+    AgentMode.IMPLEMENT: "fixed_implementation",
+    AgentMode.REVIEW: "updated_review_criteria",
+}
 
 class BaseAgent(ABC):
     """
@@ -35,9 +206,30 @@ class BaseAgent(ABC):
     agents must implement, including mode-specific restrictions and validations.
     """
     
+    # Maps error type names to the names of their recovery methods
+    _RECOVERY_STRATEGIES: Dict[str, str] = {
+        "ValueError": "_recover_value_error",
+        "TypeError": "_recover_type_error",
+        "KeyError": "_recover_key_error",
+        "FileNotFoundError": "_recover_file_error",
+        "PermissionError": "_recover_permission_error",
+        "TimeoutError": "_recover_timeout_error"
+    }
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve the dispatch table to plain functions once per class, so
+        # overridden recovery methods are honoured without per-call lookups.
+        cls._recovery_strategies = {
+            error_type: getattr(cls, method_name)
+            for error_type, method_name in cls._RECOVERY_STRATEGIES.items()
+        }
+        
     def __init__(self, mode: AgentMode):
         self.mode = mode
-        self.restrictions = self._get_mode_restrictions()
+        self.restrictions = _restrictions_for(mode)
+        self._allowed_actions = _ALLOWED_ACTIONS[mode]
+        self._quality_thresholds = _QUALITY_THRESHOLDS[mode]
         
     @abstractmethod
     async def execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
@@ -46,145 +238,19 @@ class BaseAgent(ABC):
         
     def _get_mode_restrictions(self) -> AgentRestrictions:
         """Get the restrictions for the current mode."""
-        if self.mode == AgentMode.VAN:
-            return AgentRestrictions(
-                allowed_actions=[
-                    "read_system_data",
-                    "analyze_metrics",
-                    "validate_requirements",
-                    "generate_reports"
-                ],
-                forbidden_actions=[
-                    "modify_code",
-                    "create_designs",
-                    "make_implementation_decisions",
-                    "deploy_code"
-                ],
-                required_outputs=[
-                    "analysis_report",
-                    "validation_results",
-                    "metric_dashboard"
-                ],
-                quality_thresholds={
-                    "analysis_coverage": 0.8,
-                    "validation_accuracy": 0.9,
-                    "report_quality": 0.85
-                }
-            )
-        elif self.mode == AgentMode.PLAN:
-            return AgentRestrictions(
-                allowed_actions=[
-                    "create_plans",
-                    "define_requirements",
-                    "allocate_resources",
-                    "set_milestones"
-                ],
-                forbidden_actions=[
-                    "modify_code",
-                    "execute_plans",
-                    "modify_systems",
-                    "deploy_changes"
-                ],
-                required_outputs=[
-                    "project_plan",
-                    "resource_allocation",
-                    "technical_requirements"
-                ],
-                quality_thresholds={
-                    "plan_completeness": 0.9,
-                    "requirement_clarity": 0.85,
-                    "resource_efficiency": 0.8
-                }
-            )
-        elif self.mode == AgentMode.CREATE:
-            return AgentRestrictions(
-                allowed_actions=[
-                    "generate_code",
-                    "design_architecture",
-                    "create_specifications",
-                    "develop_schemas"
-                ],
-                forbidden_actions=[
-                    "deploy_code",
-                    "modify_production",
-                    "change_requirements",
-                    "execute_code"
-                ],
-                required_outputs=[
-                    "source_code",
-                    "technical_specs",
-                    "architecture_design"
-                ],
-                quality_thresholds={
-                    "code_quality": 0.85,
-                    "design_completeness": 0.9,
-                    "spec_clarity": 0.8
-                }
-            )
-        elif self.mode == AgentMode.IMPLEMENT:
-            return AgentRestrictions(
-                allowed_actions=[
-                    "deploy_code",
-                    "integrate_components",
-                    "configure_systems",
-                    "run_tests"
-                ],
-                forbidden_actions=[
-                    "modify_requirements",
-                    "change_architecture",
-                    "create_designs",
-                    "exceed_scope"
-                ],
-                required_outputs=[
-                    "deployment_report",
-                    "test_results",
-                    "integration_status"
-                ],
-                quality_thresholds={
-                    "deployment_success": 0.95,
-                    "test_coverage": 0.9,
-                    "integration_quality": 0.85
-                }
-            )
-        elif self.mode == AgentMode.REVIEW:
-            return AgentRestrictions(
-                allowed_actions=[
-                    "review_code",
-                    "assess_quality",
-                    "identify_issues",
-                    "provide_feedback"
-                ],
-                forbidden_actions=[
-                    "modify_code",
-                    "implement_fixes",
-                    "change_designs",
-                    "deploy_changes"
-                ],
-                required_outputs=[
-                    "review_report",
-                    "quality_assessment",
-                    "improvement_suggestions"
-                ],
-                quality_thresholds={
-                    "review_coverage": 0.9,
-                    "assessment_accuracy": 0.85,
-                    "feedback_quality": 0.8
-                }
-            )
-        else:
-            raise ValueError(f"Unknown mode: {self.mode}")
+        return _restrictions_for(self.mode)
             
     def validate_action(self, action: str) -> bool:
         """Validate if an action is allowed in the current mode."""
-        return (action in self.restrictions.allowed_actions and 
-                action not in self.restrictions.forbidden_actions)
+        return action in self._allowed_actions
                 
     def validate_output_quality(self, output_metrics: Dict[str, float]) -> bool:
         """Validate if the output meets quality thresholds."""
-        return all(
-            output_metrics.get(metric, 0) >= threshold 
-            for metric, threshold in self.restrictions.quality_thresholds.items()
-        )
+        get_metric = output_metrics.get
+        for metric, threshold in self._quality_thresholds:
+            if get_metric(metric, 0) < threshold:
+                return False
+        return True
 
     @contextmanager
     def error_handling_context(self):
@@ -229,18 +295,11 @@ class BaseAgent(ABC):
         """Attempt to recover from an error based on error type and mode."""
         error_type = error_info["type"]
         
-        recovery_strategies = {
-            "ValueError": self._recover_value_error,
-            "TypeError": self._recover_type_error,
-            "KeyError": self._recover_key_error,
-            "FileNotFoundError": self._recover_file_error,
-            "PermissionError": self._recover_permission_error,
-            "TimeoutError": self._recover_timeout_error
-        }
+        strategy = self._recovery_strategies.get(error_type)
         
-        if error_type in recovery_strategies:
+        if strategy is not None:
             try:
-                return recovery_strategies[error_type](error_info)
+                return strategy(self, error_info)
             except Exception as recovery_error:
                 return {
                     "success": False,
@@ -259,16 +318,9 @@ class BaseAgent(ABC):
             logging.info(f"Attempting to recover from ValueError in {self.mode} mode")
             
             # Implement mode-specific recovery logic
-            if self.mode == AgentMode.VAN:
-                return {"success": True, "action": "validated_inputs"}
-            elif self.mode == AgentMode.PLAN:
-                return {"success": True, "action": "adjusted_plan"}
-            elif self.mode == AgentMode.CREATE:
-                return {"success": True, "action": "corrected_parameters"}
-            elif self.mode == AgentMode.IMPLEMENT:
-                return {"success": True, "action": "fixed_implementation"}
-            elif self.mode == AgentMode.REVIEW:
-                return {"success": True, "action": "updated_review_criteria"}
+            action = _VALUE_ERROR_ACTIONS.get(self.mode)
+            if action:
+                return {"success": True, "action": action}
             
             return {"success": False, "error": "Unsupported mode for recovery"}
             
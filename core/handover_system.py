@@ -2,19 +2,65 @@
 GENXAIS Framework - Handover System Implementation
 """
 
-import os
 import json
+import uuid
+import asyncio
 import logging
+import weakref
+import orjson
 from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime, timedelta
 from pathlib import Path
+import aiofiles
+import aiofiles.os
 import pymongo
-from pymongo import MongoClient
+from pymongo import WriteConcern, IndexModel
+from pymongo.errors import BulkWriteError, OperationFailure
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorCollection,
+    AsyncIOMotorDatabase
+)
 from cryptography.fernet import Fernet
 from dataclasses import dataclass
 
 from error_handling.framework import SDKErrorHandler
 
+# Allowed (source, target) mode transitions
+_VALID_TRANSITIONS: frozenset = frozenset({
+    ("VAN", "PLAN"),
+    ("PLAN", "CREATE"),
+    ("CREATE", "IMPLEMENT"),
+    ("IMPLEMENT", "REFLECT"),
+    ("REFLECT", "ARCHIVE"),
+    ("REFLECT", "VAN")
+})
+_VALID_SOURCES: frozenset = frozenset(source for source, _ in _VALID_TRANSITIONS)
+
+# Context keys that save_context also stores unencrypted on the handover document
+_METADATA_FIELDS: Dict[str, str] = {
+    "mode": "source",
+    "target_mode": "target",
+    "session_id": "metadata.session_id",
+    "user_id": "metadata.user_id",
+    "artifacts": "metadata.artifacts"
+}
+
+# One Motor client (and thus one connection pool) per MongoDB URI and event
+# loop; a client is bound to the loop it first ran on and dies with it
+_CLIENT_CACHE: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncIOMotorClient]]" = \
+    weakref.WeakKeyDictionary()
+
+# (uri, database) pairs whose handover indexes were already ensured in this process
+_INDEXES_CREATED: set = set()
+
+# Server error code for a duplicate _id, i.e. a document already written
+_DUPLICATE_KEY_ERROR = 11000
+
+# Server error code for an index that exists with different options, e.g. a
+# TTL index created with an earlier retention_days
+_INDEX_OPTIONS_CONFLICT = 85
+
 @dataclass
 class HandoverError(Exception):
     """Custom error for handover operations"""
@@ -28,10 +74,23 @@ class HandoverSystem:
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or self._load_default_config()
         self.logger = self._setup_logging()
-        self.db = self._init_mongodb()
         self.crypto = self._init_encryption()
         self.error_handler = SDKErrorHandler()  # Verwende das zentrale Error-Handling
         self.success_handlers: List[Callable] = []
+        self._dispatch_success = self._compile_dispatch(())
+        # Optional micro-batching of handover writes; a batch size of 1 keeps
+        # save_context write-through.
+        self._batch_size = max(1, int(self.config.get("handover_batch_size", 1)))
+        self._pending: List[tuple] = []
+        # A partial batch is flushed after this many seconds at the latest
+        self._flush_interval = float(self.config.get("handover_flush_interval", 5.0))
+        self._flush_task: Optional[asyncio.Task] = None
+        # Default directory for persist_to_filesystem, created once up front
+        self._persist_dir = Path(self.config.get("persist_path", "memory-bank/handover"))
+        self._persist_dir.mkdir(parents=True, exist_ok=True)
+        self._known_dirs = {self._persist_dir}
+        # Last decrypted context per query, as (document _id, context)
+        self._context_cache: Dict[str, tuple] = {}
         
     def _load_default_config(self) -> Dict[str, Any]:
         """Load default configuration"""
@@ -51,25 +110,43 @@ class HandoverSystem:
     def _setup_logging(self) -> logging.Logger:
         """Setup logging for handover operations"""
         logger = logging.getLogger("HandoverSystem")
-        handler = logging.FileHandler(self.config.get("log_file", "logs/handover.log"))
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
+        # The logger is process-wide; attach the file handler only once so
+        # log lines are not duplicated per HandoverSystem instance.
+        if not logger.handlers:
+            handler = logging.FileHandler(
+                self.config.get("log_file", "logs/handover.log"),
+                delay=True
+            )
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
         return logger
         
-    def _init_mongodb(self) -> pymongo.database.Database:
+    @property
+    def db(self) -> AsyncIOMotorDatabase:
+        """Handover database on the client shared within the running event loop"""
+        return self._init_mongodb()
+        
+    def _init_mongodb(self) -> AsyncIOMotorDatabase:
         """Initialize MongoDB connection"""
         try:
-            client = MongoClient(self.config["mongodb_uri"])
-            db = client[self.config["database"]]
-            # Ensure indexes
-            db.handovers.create_index([("timestamp", pymongo.DESCENDING)])
-            db.handovers.create_index([("source", pymongo.ASCENDING)])
-            db.handovers.create_index([("target", pymongo.ASCENDING)])
-            return db
+            uri = self.config["mongodb_uri"]
+            try:
+                clients = _CLIENT_CACHE.setdefault(asyncio.get_running_loop(), {})
+            except RuntimeError:
+                # No running loop to bind a shared client to
+                clients = {}
+            client = clients.get(uri)
+            if client is None:
+                client = clients[uri] = AsyncIOMotorClient(
+                    uri,
+                    maxPoolSize=50,
+                    compressors="zstd,zlib"
+                )
+            return client[self.config["database"]]
         except Exception as e:
             self.logger.error(f"MongoDB initialization failed: {e}")
             return self.error_handler.handle_error(
@@ -78,6 +155,71 @@ class HandoverSystem:
                 "MongoDB initialization failed"
             )
             
+    async def _ensure_indexes(self) -> None:
+        """Ensure handover indexes once per process, in a single command
+        
+        Indexes only speed up reads and expire old handovers, so a failure
+        is logged and does not fail the write that triggered it.
+        """
+        index_key = (self.config["mongodb_uri"], self.config["database"])
+        if index_key in _INDEXES_CREATED:
+            return
+            
+        _INDEXES_CREATED.add(index_key)
+        retention_seconds = self.config.get("retention_days", 30) * 86400
+        indexes = [
+            # TTL index: the server expires old handovers itself; it
+            # also serves descending timestamp sorts.
+            IndexModel(
+                [("timestamp", pymongo.ASCENDING)],
+                expireAfterSeconds=retention_seconds
+            ),
+            IndexModel([
+                ("source", pymongo.ASCENDING),
+                ("target", pymongo.ASCENDING)
+            ])
+        ]
+        try:
+            try:
+                await self.db.handovers.create_indexes(indexes)
+            except OperationFailure as e:
+                if e.code != _INDEX_OPTIONS_CONFLICT:
+                    raise
+                # The retention changed: update the existing TTL in place
+                await self.db.command(
+                    "collMod",
+                    "handovers",
+                    index={
+                        "keyPattern": {"timestamp": pymongo.ASCENDING},
+                        "expireAfterSeconds": retention_seconds
+                    }
+                )
+                await self.db.handovers.create_indexes(indexes)
+        except Exception as e:
+            self.logger.error(f"Failed to ensure handover indexes: {e}")
+            self.error_handler.handle_error(
+                "db_index_error",
+                {"error": str(e)},
+                "Failed to ensure handover indexes"
+            )
+            
+    @property
+    def _handovers(self) -> AsyncIOMotorCollection:
+        """Handover collection with acknowledged writes"""
+        return self.db.handovers.with_options(write_concern=WriteConcern(w=1))
+        
+    @property
+    def _handovers_bulk(self) -> AsyncIOMotorCollection:
+        """Handover collection for bulk writes without journal wait"""
+        return self.db.handovers.with_options(
+            write_concern=WriteConcern(w=1, j=False)
+        )
+        
+    @property
+    def _persistent_data(self) -> AsyncIOMotorCollection:
+        """Persistence collection with acknowledged writes"""
+        return self.db.persistent_data.with_options(write_concern=WriteConcern(w=1))
+        
     def _init_encryption(self) -> Fernet:
         """Initialize encryption"""
         try:
@@ -94,78 +236,212 @@ class HandoverSystem:
     def on_success(self, handler: Callable):
         """Register success handler"""
         self.success_handlers.append(handler)
+        self._dispatch_success = self._compile_dispatch(tuple(self.success_handlers))
         return handler
         
+    def _compile_dispatch(self, handlers: tuple) -> Callable[[Dict[str, Any]], None]:
+        """Build the success dispatcher for a fixed tuple of handlers"""
+        if not handlers:
+            return lambda context: None
+            
+        # Hoist attribute lookups out of the per-notification loop
+        log_error = self.logger.error
+        handle_error = self.error_handler.handle_error
+        
+        def dispatch(context: Dict[str, Any]) -> None:
+            for handler in handlers:
+                try:
+                    handler(context)
+                except Exception as e:
+                    log_error(f"Success handler failed: {e}")
+                    handle_error(
+                        "handler_error",
+                        {"error": str(e)},
+                        "Success handler failed"
+                    )
+                    
+        return dispatch
+        
     def _notify_success(self, context: Dict[str, Any]):
         """Notify all success handlers"""
-        for handler in self.success_handlers:
-            try:
-                handler(context)
-            except Exception as e:
-                self.logger.error(f"Success handler failed: {e}")
-                self.error_handler.handle_error(
-                    "handler_error",
-                    {"error": str(e)},
-                    "Success handler failed"
-                )
+        self._dispatch_success(context)
                 
-    def save_context(self, context: Dict[str, Any]) -> bool:
+    def _encrypt_json(self, obj: Dict[str, Any]) -> bytes:
+        """Serialize compactly and encrypt with the shared Fernet instance"""
+        return self.crypto.encrypt(orjson.dumps(obj))
+        
+    def _decrypt_json(self, token: Any) -> Dict[str, Any]:
+        """Decrypt a stored Fernet token and parse its JSON payload"""
+        # Tokens are stored as BSON binary; older documents hold them as str
+        if isinstance(token, str):
+            token = token.encode("ascii")
+        return orjson.loads(self.crypto.decrypt(token))
+        
+    def _build_handover_doc(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Encrypt a context and wrap it in a handover document"""
+        # Encrypt sensitive data
+        encrypted_data = self._encrypt_json(context)
+        
+        return {
+            "timestamp": datetime.utcnow(),
+            "data": encrypted_data,
+            "source": context.get("mode"),
+            "target": context.get("target_mode"),
+            "metadata": {
+                "session_id": context.get("session_id"),
+                "user_id": context.get("user_id"),
+                "artifacts": context.get("artifacts", [])
+            }
+        }
+        
+    async def save_context(self, context: Dict[str, Any]) -> bool:
         """Save current context"""
         try:
-            # Encrypt sensitive data
-            encrypted_data = self.crypto.encrypt(
-                json.dumps(context).encode()
-            ).decode()
-            
-            # Prepare document
-            doc = {
-                "timestamp": datetime.utcnow(),
-                "data": encrypted_data,
-                "source": context.get("mode"),
-                "target": context.get("target_mode"),
-                "metadata": {
-                    "session_id": context.get("session_id"),
-                    "user_id": context.get("user_id"),
-                    "artifacts": context.get("artifacts", [])
-                }
-            }
+            doc = self._build_handover_doc(context)
+            
+            if self._batch_size > 1:
+                # Buffer and write in bulk once the batch is full
+                self._pending.append((doc, context))
+                if len(self._pending) >= self._batch_size:
+                    return await self.flush()
+                self._schedule_flush()
+                return True
             
             # Save to MongoDB
-            result = self.db.handovers.insert_one(doc)
+            await self._ensure_indexes()
+            # Acknowledged writes raise on failure, so success is straight-line
+            result = await self._handovers.insert_one(doc)
+            self._context_cache.clear()
+            self.logger.info(f"Context saved successfully: {result.inserted_id}")
+            self._notify_success(context)
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to save context: {e}")
+            self.error_handler.handle_error(
+                "save_error",
+                {"error": str(e)},
+                "Failed to save context"
+            )
+            return False
+            
+    async def save_contexts_bulk(self, contexts: List[Dict[str, Any]]) -> bool:
+        """Save several contexts with a single unordered bulk insert
+        
+        Contexts that could not be written stay buffered and are retried.
+        """
+        try:
+            self._pending.extend(
+                (self._build_handover_doc(context), context) for context in contexts
+            )
+            return await self.flush()
+        except Exception as e:
+            self.logger.error(f"Failed to save contexts: {e}")
+            self.error_handler.handle_error(
+                "save_error",
+                {"error": str(e)},
+                "Failed to save contexts"
+            )
+            return False
+            
+    async def flush(self) -> bool:
+        """Write all buffered handover documents to MongoDB
+        
+        Documents that could not be written stay buffered for the next flush.
+        """
+        if not self._pending:
+            return True
+            
+        pending, self._pending = self._pending, []
+        try:
+            await self._ensure_indexes()
+            result = await self._handovers_bulk.insert_many(
+                [doc for doc, _ in pending],
+                ordered=False
+            )
             
-            if result.inserted_id:
-                self.logger.info(f"Context saved successfully: {result.inserted_id}")
+            self._context_cache.clear()
+            self.logger.info(f"Saved {len(result.inserted_ids)} contexts in bulk")
+            for _, context in pending:
                 self._notify_success(context)
+            return True
+            
+        except BulkWriteError as e:
+            # insert_many assigned each document its _id, so documents written
+            # by an earlier attempt fail as duplicates and count as saved
+            failed = {
+                error["index"] for error in e.details.get("writeErrors", [])
+                if error.get("code") != _DUPLICATE_KEY_ERROR
+            }
+            self._context_cache.clear()
+            for index, (_, context) in enumerate(pending):
+                if index not in failed:
+                    self._notify_success(context)
+            self._pending[:0] = [entry for index, entry in enumerate(pending) if index in failed]
+            if not failed:
                 return True
+            self._schedule_flush()
+            self.logger.error(f"Failed to flush {len(failed)} contexts: {e}")
+            self.error_handler.handle_error(
+                "save_error",
+                {"error": str(e)},
+                "Failed to flush buffered contexts"
+            )
             return False
             
         except Exception as e:
-            self.logger.error(f"Failed to save context: {e}")
+            self._pending[:0] = pending
+            self._schedule_flush()
+            self.logger.error(f"Failed to flush contexts: {e}")
             self.error_handler.handle_error(
                 "save_error",
                 {"error": str(e)},
-                "Failed to save context"
+                "Failed to flush buffered contexts"
             )
             return False
             
-    def load_context(self) -> Dict[str, Any]:
-        """Load saved context"""
+    def _schedule_flush(self) -> None:
+        """Start the timer that flushes a partial batch, unless it is running"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+            
+    async def _flush_later(self) -> None:
+        """Flush buffered documents after the flush interval until none are left"""
+        while self._pending:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+            
+    async def close(self) -> bool:
+        """Write all buffered handover documents and stop the flush timer
+        
+        Call before the event loop shuts down; documents still buffered
+        after a failed final flush are lost.
+        """
+        saved = await self.flush()
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        return saved
+        
+    async def load_context(self, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Load saved context, optionally restricted to the given fields"""
         try:
+            # Make buffered writes visible before reading
+            await self.flush()
+            
+            # Metadata-only requests are answered without decrypting the payload
+            if fields and all(field in _METADATA_FIELDS for field in fields):
+                return await self._load_metadata_fields(fields)
+            
             # Get latest handover
-            doc = self.db.handovers.find_one(
-                sort=[("timestamp", pymongo.DESCENDING)]
-            )
+            context = await self._find_latest_context("latest", {})
             
-            if not doc:
+            if context is None:
                 return {}
                 
-            # Decrypt data
-            decrypted_data = self.crypto.decrypt(
-                doc["data"].encode()
-            ).decode()
-            
-            context = json.loads(decrypted_data)
             self.logger.info("Context loaded successfully")
+            if fields:
+                return {field: context[field] for field in fields if field in context}
             return context
             
         except Exception as e:
@@ -177,33 +453,84 @@ class HandoverSystem:
             )
             return {}
             
+    async def _find_latest_context(
+        self,
+        cache_key: str,
+        query: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Return the decrypted context of the newest document matching query
+        
+        Only the ``_id`` is fetched first; the payload is fetched and decrypted
+        again only if it differs from the cached document.
+        """
+        head = await self.db.handovers.find_one(
+            query,
+            projection={"_id": 1},
+            sort=[("timestamp", pymongo.DESCENDING)]
+        )
+        
+        if not head:
+            return None
+            
+        cached = self._context_cache.get(cache_key)
+        if cached is not None and cached[0] == head["_id"]:
+            return dict(cached[1])
+            
+        doc = await self.db.handovers.find_one({"_id": head["_id"]})
+        if not doc:
+            return None
+            
+        # Decrypt data
+        context = self._decrypt_json(doc["data"])
+        self._context_cache[cache_key] = (head["_id"], context)
+        return dict(context)
+        
+    async def _load_metadata_fields(self, fields: List[str]) -> Dict[str, Any]:
+        """Read plain metadata fields of the latest handover via projection"""
+        doc = await self.db.handovers.find_one(
+            projection={_METADATA_FIELDS[field]: 1 for field in fields},
+            sort=[("timestamp", pymongo.DESCENDING)]
+        )
+        
+        if not doc:
+            return {}
+            
+        result = {}
+        for field in fields:
+            value = doc
+            for part in _METADATA_FIELDS[field].split("."):
+                value = value.get(part) if isinstance(value, dict) else None
+            if value is not None:
+                result[field] = value
+        return result
+        
     def validate_handover(self, source: str, target: str) -> bool:
         """Validate mode transition"""
-        valid_transitions = {
-            "VAN": ["PLAN"],
-            "PLAN": ["CREATE"],
-            "CREATE": ["IMPLEMENT"],
-            "IMPLEMENT": ["REFLECT"],
-            "REFLECT": ["ARCHIVE", "VAN"]
-        }
-        
-        if source not in valid_transitions:
+        if source not in _VALID_SOURCES:
             self.logger.error(f"Invalid source mode: {source}")
             return False
             
-        if target not in valid_transitions[source]:
+        if (source, target) not in _VALID_TRANSITIONS:
             self.logger.error(f"Invalid transition: {source} -> {target}")
             return False
             
         return True
         
-    def cleanup_old_handovers(self, days: int = None) -> None:
-        """Clean up old handover data"""
+    async def cleanup_old_handovers(self, days: int = None) -> None:
+        """Clean up old handover data
+        
+        Expiry after the configured retention period is handled by the TTL
+        index on ``timestamp``; an explicit ``days`` value forces an immediate
+        cleanup with a shorter retention.
+        """
         try:
-            retention_days = days or self.config.get("retention_days", 30)
-            cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
+            if days is None:
+                self.logger.debug("Handover expiry is handled by the TTL index")
+                return
+                
+            cutoff_date = datetime.utcnow() - timedelta(days=days)
             
-            result = self.db.handovers.delete_many({
+            result = await self.db.handovers.delete_many({
                 "timestamp": {"$lt": cutoff_date}
             })
             
@@ -217,28 +544,31 @@ class HandoverSystem:
                 "Failed to clean up old handovers"
             )
             
-    def persist_to_filesystem(
+    async def persist_to_filesystem(
         self,
         data: Dict[str, Any],
-        path: str = "memory-bank/handover"
+        path: Optional[str] = None
     ) -> bool:
         """Persist handover data to filesystem"""
         try:
-            # Create directory if not exists
-            os.makedirs(path, exist_ok=True)
+            directory = Path(path) if path else self._persist_dir
+            # Create directory if not seen yet
+            if directory not in self._known_dirs:
+                directory.mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(directory)
             
             # Create timestamped filename
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            filename = f"handover_{timestamp}.json"
-            filepath = os.path.join(path, filename)
+            filepath = directory / f"handover_{timestamp}.json"
+            # Unique per write, so concurrent writes never share a temp file
+            tmp_path = directory / f".{filepath.stem}.{uuid.uuid4().hex}.tmp"
             
-            # Encrypt and save data
-            encrypted_data = self.crypto.encrypt(
-                json.dumps(data).encode()
-            ).decode()
+            # Encrypt and save data; the rename makes the write atomic
+            encrypted_data = self._encrypt_json(data).decode("ascii")
             
-            with open(filepath, "w") as f:
-                json.dump({"data": encrypted_data}, f)
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(orjson.dumps({"data": encrypted_data}))
+            await aiofiles.os.replace(tmp_path, filepath)
                 
             self.logger.info(f"Data persisted to filesystem: {filepath}")
             return True
@@ -252,13 +582,11 @@ class HandoverSystem:
             )
             return False
             
-    def persist_to_mongodb(self, data: Dict[str, Any]) -> bool:
+    async def persist_to_mongodb(self, data: Dict[str, Any]) -> bool:
         """Persist handover data to MongoDB"""
         try:
             # Encrypt data
-            encrypted_data = self.crypto.encrypt(
-                json.dumps(data).encode()
-            ).decode()
+            encrypted_data = self._encrypt_json(data)
             
             # Prepare document
             doc = {
@@ -271,12 +599,9 @@ class HandoverSystem:
             }
             
             # Save to MongoDB
-            result = self.db.persistent_data.insert_one(doc)
-            
-            if result.inserted_id:
-                self.logger.info(f"Data persisted to MongoDB: {result.inserted_id}")
-                return True
-            return False
+            result = await self._persistent_data.insert_one(doc)
+            self.logger.info(f"Data persisted to MongoDB: {result.inserted_id}")
+            return True
             
         except Exception as e:
             self.logger.error(f"MongoDB persistence failed: {e}")
@@ -287,25 +612,19 @@ class HandoverSystem:
             )
             return False
             
-    def recover_last_successful(self) -> Optional[Dict[str, Any]]:
+    async def recover_last_successful(self) -> Optional[Dict[str, Any]]:
         """Recover last successful handover"""
         try:
             # Get last successful handover
-            doc = self.db.handovers.find_one(
-                {"metadata.status": "success"},
-                sort=[("timestamp", pymongo.DESCENDING)]
+            context = await self._find_latest_context(
+                "last_successful",
+                {"metadata.status": "success"}
             )
             
-            if not doc:
+            if context is None:
                 self.logger.warning("No successful handover found")
                 return None
                 
-            # Decrypt data
-            decrypted_data = self.crypto.decrypt(
-                doc["data"].encode()
-            ).decode()
-            
-            context = json.loads(decrypted_data)
             self.logger.info("Successfully recovered last handover")
             return context
             
@@ -318,10 +637,10 @@ class HandoverSystem:
             )
             return None
             
-    def notify_target_mode(self) -> None:
+    async def notify_target_mode(self) -> None:
         """Notify target mode about pending handover"""
         try:
-            context = self.load_context()
+            context = await self.load_context(fields=["target_mode"])
             target_mode = context.get("target_mode")
             
             if not target_mode:
@@ -5,13 +5,19 @@ This module provides integration with LangGraph for creating and managing agent
 """
 
 from enum import Enum
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Mapping
 from dataclasses import dataclass, field
-from datetime import datetime
+import asyncio
+from collections import ChainMap
+import time
+import graphlib
 import logging
 
 logger = logging.getLogger("GENXAIS.LangGraphIntegration")
 
+# Collapse the layered workflow context once it grows this deep, bounding lookups
+_MAX_CONTEXT_LAYERS = 16
+
 class AgentType(Enum):
     """Available agent types in the framework."""
     TOOL_AGENT = "tool_agent"
@@ -20,7 +26,7 @@ class AgentType(Enum):
     TESTING_AGENT = "testing_agent"
     SUPERVISOR_AGENT = "supervisor_agent"
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for an agent."""
     agent_type: AgentType
@@ -31,23 +37,34 @@ class AgentConfig:
     timeout: float = 300.0
     max_retries: int = 3
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     """State of an agent during execution."""
     agent_id: str
     agent_type: AgentType
     status: str = "pending"
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
+    # Monotonic timestamps in nanoseconds (time.monotonic_ns)
+    start_time: Optional[int] = None
+    end_time: Optional[int] = None
     current_task: Optional[str] = None
     results: Dict[str, Any] = field(default_factory=dict)
     error: Optional[str] = None
+    
+    @property
+    def duration_s(self) -> Optional[float]:
+        """Run time in seconds, or None if the agent has not finished."""
+        if self.start_time is None or self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) / 1e9
 
 class WorkflowStep:
     """Represents a step in a workflow."""
     
+    __slots__ = ("name", "function", "requires", "provides", "passthrough", "_requires_tuple")
+    
     def __init__(self, name: str, function: Callable, 
-                 requires: List[str] = None, provides: List[str] = None):
+                 requires: List[str] = None, provides: List[str] = None,
+                 passthrough: bool = False):
         """
         Initialize a workflow step.
         
@@ -56,11 +73,15 @@ class WorkflowStep:
             function: Function to execute
             requires: List of required inputs
             provides: List of outputs provided
+            passthrough: Pass the whole workflow context instead of copying
+                out the required inputs (the step must not mutate it)
         """
         self.name = name
         self.function = function
         self.requires = requires or []
         self.provides = provides or []
+        self.passthrough = passthrough
+        self._requires_tuple = tuple(self.requires)
 
 class Workflow:
     """Represents a complete workflow of steps."""
@@ -76,27 +97,33 @@ class Workflow:
         self.name = name
         self.description = description
         self.steps: Dict[str, WorkflowStep] = {}
-        self.step_order: List[str] = []
+        # Maps each provided output to the step that produces it
+        self.produced_by: Dict[str, str] = {}
+        # Explicit ordering constraints from add_step(after=...)
+        self.after: Dict[str, str] = {}
+        # Memoized topological order and dependency graph, invalidated by add_step
+        self._order: Optional[List[WorkflowStep]] = None
+        self._graph = None
         
     def add_step(self, step: WorkflowStep, after: Optional[str] = None) -> None:
         """
         Add a step to the workflow.
         
+        Execution order follows the data dependencies declared via
+        requires/provides; ``after`` adds an explicit ordering constraint.
+        
         Args:
             step: The step to add
-            after: The step after which to add this step (or None for the beginning)
+            after: The step that must run before this step (or None)
         """
         self.steps[step.name] = step
+        for output in step.provides:
+            self.produced_by[output] = step.name
         
-        if after is None:
-            self.step_order.insert(0, step.name)
-        else:
-            try:
-                idx = self.step_order.index(after)
-                self.step_order.insert(idx + 1, step.name)
-            except ValueError:
-                # If 'after' step not found, add to the end
-                self.step_order.append(step.name)
+        if after is not None:
+            self.after[step.name] = after
+        self._order = None
+        self._graph = None
                 
     def get_step(self, name: str) -> Optional[WorkflowStep]:
         """
@@ -116,8 +143,84 @@ class Workflow:
         
         Returns:
             List of steps in execution order
+            
+        Raises:
+            ValueError: If the step dependencies contain a cycle
+        """
+        if self._order is None:
+            sorter = graphlib.TopologicalSorter()
+            for step in self.steps.values():
+                sorter.add(step.name, *self.get_dependencies(step))
+            try:
+                self._order = [self.steps[name] for name in sorter.static_order()]
+            except graphlib.CycleError as e:
+                raise ValueError(f"Workflow '{self.name}' has cyclic dependencies: {e.args[1]}")
+        return list(self._order)
+    
+    @property
+    def step_order(self) -> List[str]:
+        """
+        Names of all steps in execution order.
+        
+        Kept for backward compatibility; derived from the memoized
+        topological order.
         """
-        return [self.steps[name] for name in self.step_order if name in self.steps]
+        return [step.name for step in self.get_steps_in_order()]
+    
+    def get_dependencies(self, step: WorkflowStep) -> set:
+        """
+        Get the names of the steps that must run before a step.
+        
+        Args:
+            step: The step
+            
+        Returns:
+            Set of step names
+        """
+        dependencies = {
+            self.produced_by[req] for req in step.requires
+            if req in self.produced_by and self.produced_by[req] != step.name
+        }
+        after = self.after.get(step.name)
+        if after in self.steps and after != step.name:
+            dependencies.add(after)
+        return dependencies
+    
+    def build_dependency_graph(self):
+        """
+        Build the step dependency graph from requires/provides.
+        
+        The graph is computed once and reused until the next add_step;
+        callers get a fresh in-degree map and root list they may consume.
+        
+        Returns:
+            Tuple of (in-degree per step, successors per step, root steps)
+        """
+        if self._graph is None:
+            self._graph = self._compute_dependency_graph()
+        in_degree, successors, roots = self._graph
+        return dict(in_degree), successors, list(roots)
+    
+    def _compute_dependency_graph(self):
+        """
+        Compute in-degrees, successors and root steps in a single pass.
+        
+        Returns:
+            Tuple of (in-degree per step, successors per step, root steps)
+        """
+        in_degree: Dict[str, int] = {}
+        successors: Dict[str, List[str]] = {name: [] for name in self.steps}
+        roots: List[str] = []
+        
+        for step in self.steps.values():
+            producers = self.get_dependencies(step)
+            in_degree[step.name] = len(producers)
+            for producer in producers:
+                successors[producer].append(step.name)
+            if not producers:
+                roots.append(step.name)
+                
+        return in_degree, successors, roots
 
 class LangGraphIntegration:
     """
@@ -146,7 +249,7 @@ class LangGraphIntegration:
             agent_config: Configuration of the agent
         """
         self.agents[agent_config.name] = agent_config
-        logger.info(f"Agent '{agent_config.name}' registered")
+        logger.info("Agent '%s' registered", agent_config.name)
         
     def get_agent_config(self, agent_name: str) -> Optional[AgentConfig]:
         """
@@ -193,12 +296,13 @@ class LangGraphIntegration:
             
         state = self.agent_states[agent_id]
         
+        now = time.monotonic_ns()
         if status:
             state.status = status
             if status == "running" and not state.start_time:
-                state.start_time = datetime.now()
+                state.start_time = now
             elif status in ("completed", "failed"):
-                state.end_time = datetime.now()
+                state.end_time = now
                 
         if task:
             state.current_task = task
@@ -209,9 +313,9 @@ class LangGraphIntegration:
         if error:
             state.error = error
             state.status = "failed"
-            state.end_time = datetime.now()
+            state.end_time = now
             
-        logger.info(f"Agent '{agent_id}' state updated: status={status}, task={task}")
+        logger.info("Agent '%s' state updated: status=%s, task=%s", agent_id, status, task)
     
     def create_workflow(self, name: str, description: str = "") -> Workflow:
         """
@@ -226,7 +330,7 @@ class LangGraphIntegration:
         """
         workflow = Workflow(name, description)
         self.workflows[name] = workflow
-        logger.info(f"Workflow '{name}' created")
+        logger.info("Workflow '%s' created", name)
         return workflow
     
     def get_workflow(self, name: str) -> Optional[Workflow]:
@@ -259,28 +363,71 @@ class LangGraphIntegration:
         if not workflow:
             raise ValueError(f"Workflow '{workflow_name}' not found")
         
-        logger.info(f"Executing workflow '{workflow_name}'")
-        result_context = context.copy()
+        logger.info("Executing workflow '%s'", workflow_name)
+        # Each wave's outputs are layered on top instead of copied into one dict
+        result_context = ChainMap(dict(context))
+        in_degree, successors, ready = workflow.build_dependency_graph()
         
-        for step in workflow.get_steps_in_order():
-            # Check if all required inputs are available
-            missing_inputs = [req for req in step.requires if req not in result_context]
-            if missing_inputs:
-                logger.error(f"Missing required inputs for step '{step.name}': {missing_inputs}")
-                continue
+        # Run the workflow in waves: every step whose producers have finished
+        # is independent of the others in its wave and runs concurrently.
+        while ready:
+            runnable = []
+            for name in ready:
+                step = workflow.steps[name]
+                # Check if all required inputs are available
+                missing_inputs = [req for req in step._requires_tuple if req not in result_context]
+                if missing_inputs:
+                    logger.error("Missing required inputs for step '%s': %s", step.name, missing_inputs)
+                    continue
+                runnable.append(step)
             
-            # Execute the step
-            try:
-                logger.info(f"Executing step '{step.name}'")
-                step_inputs = {req: result_context[req] for req in step.requires if req in result_context}
-                step_result = await step.function(step_inputs)
-                
-                # Update context with step results
-                if isinstance(step_result, dict):
-                    result_context.update(step_result)
-            except Exception as e:
-                logger.error(f"Error executing step '{step.name}': {str(e)}")
-                # Continue with next step
-        
-        logger.info(f"Workflow '{workflow_name}' execution completed")
-        return result_context
+            results = await asyncio.gather(
+                *(self._run_step(step, result_context) for step in runnable),
+                return_exceptions=True
+            )
+            
+            outputs = {}
+            for step, step_result in zip(runnable, results):
+                if isinstance(step_result, Exception):
+                    logger.error("Error executing step '%s': %s", step.name, step_result)
+                    # Continue with the remaining steps
+                elif isinstance(step_result, dict):
+                    # Update context with step results
+                    outputs.update(step_result)
+            if outputs:
+                result_context = result_context.new_child(outputs)
+                if len(result_context.maps) > _MAX_CONTEXT_LAYERS:
+                    result_context = ChainMap(dict(result_context))
+            
+            next_ready = []
+            for name in ready:
+                for successor in successors[name]:
+                    in_degree[successor] -= 1
+                    if in_degree[successor] == 0:
+                        next_ready.append(successor)
+            ready = next_ready
+        
+        blocked = [name for name, degree in in_degree.items() if degree > 0]
+        if blocked:
+            logger.error("Steps not executed due to cyclic dependencies: %s", blocked)
+        
+        logger.info("Workflow '%s' execution completed", workflow_name)
+        return dict(result_context)
+    
+    async def _run_step(self, step: WorkflowStep, result_context: Mapping[str, Any]) -> Any:
+        """
+        Execute a single workflow step with its required inputs.
+        
+        Args:
+            step: The step to execute
+            result_context: Current workflow context
+            
+        Returns:
+            The result of the step function
+        """
+        logger.info("Executing step '%s'", step.name)
+        if step.passthrough:
+            return await step.function(result_context)
+        # Presence of all required inputs was checked before scheduling
+        step_inputs = {req: result_context[req] for req in step._requires_tuple}
+        return await step.function(step_inputs)
@@ -6,20 +6,42 @@ enabling agents to access external tools.
 """
 
 import os
-import json
+import copy
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional, Union, Callable
+import aiofiles
+import aiofiles.os
+import orjson
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple, AsyncIterator
 
 logger = logging.getLogger("GENXAIS.MCPIntegration")
 
+# Deterministic serialization of tool parameters for result cache keys
+_CACHE_KEY_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+@dataclass(slots=True)
+class ToolEntry:
+    """A registered tool."""
+    func: Callable
+    description: str
+    cacheable: bool = False
+
 class ToolRegistry:
     """Registry for tools in the GENXAIS Framework."""
     
     def __init__(self):
         """Initialize the tool registry."""
-        self.tools = {}
+        self.tools: Dict[str, ToolEntry] = {}
+        # Read-mostly views, rebuilt lazily after a registration; callers
+        # get copies, so they may modify what they are given
+        self._names_cache: Optional[Tuple[str, ...]] = None
+        self._desc_cache: Optional[Dict[str, str]] = None
         
-    def register_tool(self, name: str, func: Callable, description: str) -> None:
+    def register_tool(self, name: str, func: Callable, description: str,
+                      cacheable: bool = False) -> None:
         """
         Register a tool in the registry.
         
@@ -27,14 +49,14 @@ class ToolRegistry:
             name: Name of the tool
             func: Function that implements the tool
             description: Description of the tool
+            cacheable: Whether results may be memoized per parameters
         """
-        self.tools[name] = {
-            "func": func,
-            "description": description
-        }
-        logger.info(f"Tool \"{name}\" registered: {description}")
+        self.tools[name] = ToolEntry(func, description, cacheable)
+        self._names_cache = None
+        self._desc_cache = None
+        logger.info("Tool \"%s\" registered: %s", name, description)
         
-    def get_tool(self, name: str) -> Optional[Dict[str, Any]]:
+    def get_tool(self, name: str) -> Optional[ToolEntry]:
         """
         Get a tool from the registry.
         
@@ -53,7 +75,9 @@ class ToolRegistry:
         Returns:
             List of tool names
         """
-        return list(self.tools.keys())
+        if self._names_cache is None:
+            self._names_cache = tuple(self.tools)
+        return list(self._names_cache)
         
     def get_tool_descriptions(self) -> Dict[str, str]:
         """
@@ -62,7 +86,9 @@ class ToolRegistry:
         Returns:
             Dictionary with tool names and descriptions
         """
-        return {name: tool["description"] for name, tool in self.tools.items()}
+        if self._desc_cache is None:
+            self._desc_cache = {name: tool.description for name, tool in self.tools.items()}
+        return dict(self._desc_cache)
 
 class MCPIntegration:
     """
@@ -84,6 +110,13 @@ class MCPIntegration:
         self.api_key = self.config.get("api_key") or os.environ.get("MCP_API_KEY")
         self.timeout = self.config.get("timeout", 30)
         self.retry_attempts = self.config.get("retry_attempts", 3)
+        # Larger files must be consumed through _read_file_chunks
+        self.max_read_size = self.config.get("max_read_size", 16 * 1024 * 1024)
+        
+        # LRU of results of cacheable tools, keyed by (tool name, digest of the
+        # tool function and parameters); hits are returned as copies
+        self._result_cache: OrderedDict = OrderedDict()
+        self._result_cache_size = self.config.get("result_cache_size", 256)
         
         # Initialize tool registry
         self.tool_registry = ToolRegistry()
@@ -112,10 +145,12 @@ class MCPIntegration:
         self.register_tool(
             "search",
             self._search,
-            "Search for information"
+            "Search for information",
+            cacheable=True
         )
     
-    def register_tool(self, name: str, func: Callable, description: str) -> None:
+    def register_tool(self, name: str, func: Callable, description: str,
+                      cacheable: bool = False) -> None:
         """
         Register a tool for use with MCP.
         
@@ -123,8 +158,12 @@ class MCPIntegration:
             name: Name of the tool
             func: Function that implements the tool
             description: Description of the tool
+            cacheable: Whether results may be memoized per parameters
         """
-        self.tool_registry.register_tool(name, func, description)
+        self.tool_registry.register_tool(name, func, description, cacheable)
+        # Results of a replaced tool function must not be served any more
+        for key in [key for key in self._result_cache if key[0] == name]:
+            del self._result_cache[key]
     
     async def execute_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Any:
         """
@@ -145,14 +184,57 @@ class MCPIntegration:
         if not tool:
             raise ValueError(f"Tool '{tool_name}' not found")
         
+        cache_key = None
+        if tool.cacheable:
+            cache_key = (tool_name, hashlib.blake2b(orjson.dumps(
+                {"f": id(tool.func), "p": parameters},
+                default=str,
+                option=_CACHE_KEY_OPTIONS
+            )).digest())
+            if cache_key in self._result_cache:
+                self._result_cache.move_to_end(cache_key)
+                # Callers may mutate what they get; the cached result stays intact
+                return copy.deepcopy(self._result_cache[cache_key])
+        
         try:
-            logger.info(f"Executing tool '{tool_name}' with parameters: {parameters}")
-            result = await tool["func"](**parameters)
+            logger.info("Executing tool '%s'", tool_name)
+            # Parameters may be large; only render them when DEBUG is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Parameters for tool '%s': %s", tool_name, parameters)
+            result = await tool.func(**parameters)
+            if cache_key is not None:
+                self._result_cache[cache_key] = copy.deepcopy(result)
+                if len(self._result_cache) > self._result_cache_size:
+                    self._result_cache.popitem(last=False)
             return result
         except Exception as e:
-            logger.error(f"Error executing tool '{tool_name}': {str(e)}")
+            logger.error("Error executing tool '%s': %s", tool_name, e)
             raise
     
+    async def batch_execute_tool(self, calls: List[Tuple[str, Dict[str, Any]]],
+                                 max_concurrency: int = 8) -> List[Any]:
+        """
+        Execute several independent tool calls concurrently.
+        
+        Args:
+            calls: List of (tool name, parameters) pairs
+            max_concurrency: Maximum number of tool calls running at once
+            
+        Returns:
+            Results in the order of the calls; a failing call yields its
+            exception in place of a result instead of cancelling the batch
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _execute_one(tool_name: str, parameters: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self.execute_tool(tool_name, parameters)
+        
+        return await asyncio.gather(
+            *(_execute_one(tool_name, parameters) for tool_name, parameters in calls),
+            return_exceptions=True
+        )
+    
     async def _read_file(self, path: str) -> str:
         """
         Read the content of a file.
@@ -161,15 +243,43 @@ class MCPIntegration:
             path: Path to the file
             
         Returns:
-            Content of the file
+            Content of the file, with line endings normalized like a text-mode read
+            
+        Raises:
+            ValueError: If the file is larger than max_read_size
         """
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return f.read()
+            size = (await aiofiles.os.stat(path)).st_size
+            if size > self.max_read_size:
+                raise ValueError(
+                    f"File '{path}' is too large to read at once ({size} bytes); "
+                    f"use _read_file_chunks instead"
+                )
+            chunks = [chunk async for chunk in self._read_file_chunks(path)]
+            content = b"".join(chunks).decode("utf-8")
+            # Translate line endings like a text-mode read would
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            return content
         except Exception as e:
-            logger.error(f"Error reading file '{path}': {str(e)}")
+            logger.error("Error reading file '%s': %s", path, e)
             raise
     
+    async def _read_file_chunks(self, path: str, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        """
+        Read a file incrementally.
+        
+        Args:
+            path: Path to the file
+            chunk_size: Maximum number of bytes per chunk
+            
+        Yields:
+            Raw chunks of the file content
+        """
+        async with aiofiles.open(path, "rb") as f:
+            while chunk := await f.read(chunk_size):
+                yield chunk
+    
     async def _write_file(self, path: str, content: str) -> bool:
         """
         Write content to a file.
@@ -182,11 +292,11 @@ class MCPIntegration:
             True on success
         """
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(content)
+            async with aiofiles.open(path, "w", encoding="utf-8") as f:
+                await f.write(content)
             return True
         except Exception as e:
-            logger.error(f"Error writing to file '{path}': {str(e)}")
+            logger.error("Error writing to file '%s': %s", path, e)
             raise
     
     async def _search(self, query: str) -> List[Dict[str, Any]]:
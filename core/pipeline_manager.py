@@ -4,35 +4,57 @@ Handles creation, execution, and monitoring of development pipelines
 """
 
 import os
-import json
 import logging
 import asyncio
-from typing import Dict, List, Any, Callable, Optional, Union
+import copy
+import hashlib
+import random
+import inspect
+import graphlib
+import orjson
+from collections import deque, OrderedDict, ChainMap
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Any, Callable, Optional, Union, Mapping
 
 logger = logging.getLogger("GENXAIS.PipelineManager")
 
+# Collapse the layered pipeline state once it grows this deep, bounding lookups
+_MAX_STATE_LAYERS = 16
+
+# Deterministic serialization of step inputs for result cache keys
+_CACHE_KEY_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+class PipelineError(Exception):
+    """Raised for invalid pipeline definitions"""
+
+@dataclass(slots=True)
 class PipelineStep:
-    """Represents a step in a development pipeline"""
-    
-    def __init__(self, name: str, function: Callable, 
-                 requires: List[str] = None, provides: List[str] = None,
-                 error_handlers: List[Callable] = None, retry_policy: Dict[str, Any] = None):
-        """Initialize a pipeline step"""
-        self.name = name
-        self.function = function
-        self.requires = requires or []
-        self.provides = provides or []
-        self.error_handlers = error_handlers or []
-        self.retry_policy = retry_policy or {"max_retries": 3}
+    """Represents a step in a development pipeline
+    
+    Steps marked cacheable must be pure functions of their required inputs;
+    their results are memoized per (step name, required inputs).
+    """
+    name: str
+    function: Callable
+    requires: List[str] = field(default_factory=list)
+    provides: List[str] = field(default_factory=list)
+    error_handlers: List[Callable] = field(default_factory=list)
+    retry_policy: Dict[str, Any] = field(default_factory=lambda: {"max_retries": 3})
+    cacheable: bool = False
+    
+    def __post_init__(self):
+        # Explicit None still means "use the default"
+        self.requires = self.requires or []
+        self.provides = self.provides or []
+        self.error_handlers = self.error_handlers or []
+        self.retry_policy = self.retry_policy or {"max_retries": 3}
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert step to dictionary representation"""
+        # Not asdict(): it deep-copies callables, including bound methods' objects
         return {
-            "name": self.name,
-            "requires": self.requires,
-            "provides": self.provides,
-            "error_handlers": self.error_handlers,
-            "retry_policy": self.retry_policy
+            f.name: copy.copy(getattr(self, f.name))
+            for f in fields(self) if f.name != "function"
         }
 
 class PipelineManager:
@@ -43,16 +65,211 @@ class PipelineManager:
         self.pipelines = {}
         self.config = config or {}
         self.logger = logger
+        # Caps concurrently running steps, e.g. to respect provider rate limits
+        self._semaphore = asyncio.Semaphore(self.config.get("max_concurrency", 8))
+        # LRU of results of cacheable steps, keyed by step name and inputs
+        self._result_cache: OrderedDict = OrderedDict()
+        self._result_cache_size = self.config.get("result_cache_size", 256)
         self.logger.info("Pipeline Manager initialized")
     
     async def create_pipeline(self, name: str, steps: List[PipelineStep]) -> str:
         """Create a new pipeline"""
+        dependencies = self._step_dependencies(steps)
+        self._validate_pipeline(name, dependencies)
+        
         pipeline_id = f"pipeline_{len(self.pipelines) + 1}"
         self.pipelines[pipeline_id] = {
             "name": name,
             "steps": [step.to_dict() for step in steps],
+            "graph": self._build_graph(steps, dependencies),
             "status": "created",
             "results": {}
         }
-        self.logger.info(f"Created pipeline: {name} (ID: {pipeline_id})")
+        self.logger.info("Created pipeline: %s (ID: %s)", name, pipeline_id)
         return pipeline_id
+    
+    def _step_dependencies(self, steps: List[PipelineStep]) -> Dict[str, set]:
+        """Map each step to the steps producing its required inputs"""
+        producers = {}
+        for step in steps:
+            for output in step.provides:
+                producers[output] = step.name
+        
+        return {
+            step.name: {
+                producers[req] for req in step.requires
+                if req in producers and producers[req] != step.name
+            }
+            for step in steps
+        }
+    
+    def _validate_pipeline(self, name: str, dependencies: Dict[str, set]) -> None:
+        """Fail fast on cyclic step dependencies"""
+        try:
+            graphlib.TopologicalSorter(dependencies).prepare()
+        except graphlib.CycleError as e:
+            raise PipelineError(f"Pipeline {name} has cyclic dependencies: {e.args[1]}")
+    
+    def _build_graph(self, steps: List[PipelineStep],
+                     dependencies: Dict[str, set]) -> Dict[str, Any]:
+        """Precompute the step dependency graph once per pipeline"""
+        successors = {step.name: [] for step in steps}
+        in_degree = {}
+        roots = []
+        for step in steps:
+            step_dependencies = dependencies[step.name]
+            in_degree[step.name] = len(step_dependencies)
+            for dependency in step_dependencies:
+                successors[dependency].append(step.name)
+            if not step_dependencies:
+                roots.append(step.name)
+        
+        return {
+            "steps": {step.name: step for step in steps},
+            "successors": successors,
+            "in_degree": in_degree,
+            "roots": roots
+        }
+    
+    async def execute_pipeline(self, pipeline_id: str,
+                               input_data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Execute a pipeline, running each wave of ready steps concurrently"""
+        pipeline = self.pipelines.get(pipeline_id)
+        if not pipeline:
+            raise ValueError(f"Pipeline '{pipeline_id}' not found")
+        
+        graph = pipeline["graph"]
+        in_degree = dict(graph["in_degree"])
+        ready = deque(graph["roots"])
+        # Each wave's outputs are layered on top instead of copied into one dict
+        state = ChainMap(dict(input_data or {}))
+        # Set when a step fails for good, so running siblings stop retrying
+        cancel = asyncio.Event()
+        
+        pipeline["status"] = "running"
+        self.logger.info("Executing pipeline: %s (ID: %s)", pipeline["name"], pipeline_id)
+        
+        try:
+            while ready:
+                wave = [graph["steps"][ready.popleft()] for _ in range(len(ready))]
+                results = await asyncio.gather(
+                    *(self._execute_step_with_retry(step, state, cancel, pipeline_id) for step in wave),
+                    return_exceptions=True
+                )
+                
+                failures = [result for result in results if isinstance(result, Exception)]
+                if failures:
+                    raise failures[0]
+                
+                outputs = {}
+                for step, result in zip(wave, results):
+                    if isinstance(result, dict):
+                        outputs.update(result)
+                    for successor in graph["successors"][step.name]:
+                        in_degree[successor] -= 1
+                        if in_degree[successor] == 0:
+                            ready.append(successor)
+                if outputs:
+                    state = state.new_child(outputs)
+                    if len(state.maps) > _MAX_STATE_LAYERS:
+                        state = ChainMap(dict(state))
+        except Exception as e:
+            pipeline["status"] = "failed"
+            self.logger.error("Pipeline %s failed: %s", pipeline_id, e)
+            raise
+        
+        results = dict(state)
+        pipeline["status"] = "completed"
+        pipeline["results"] = results
+        self.logger.info("Pipeline %s completed", pipeline_id)
+        return results
+    
+    async def _execute_step_with_retry(self, step: PipelineStep,
+                                       state: Mapping[str, Any],
+                                       cancel: Optional[asyncio.Event] = None,
+                                       pipeline_id: str = "") -> Any:
+        """Execute a step, retrying according to its retry policy"""
+        cache_key = self._cache_key(step, state, pipeline_id) if step.cacheable else None
+        if cache_key is not None and cache_key in self._result_cache:
+            self._result_cache.move_to_end(cache_key)
+            self.logger.info("Using cached result for step %s", step.name)
+            # Copies keep callers from mutating the cached result
+            return copy.deepcopy(self._result_cache[cache_key])
+        
+        max_retries = step.retry_policy.get("max_retries", 3)
+        delay = step.retry_policy.get("delay", 1.0)
+        no_retry = tuple(step.retry_policy.get("no_retry_exceptions", ()))
+        
+        for attempt in range(max_retries + 1):
+            if cancel is not None and cancel.is_set():
+                raise RuntimeError(f"Step {step.name} aborted after a pipeline failure")
+            try:
+                async with self._semaphore:
+                    result = await self._call(step.function, state)
+                if cache_key is not None:
+                    self._store_result(cache_key, result)
+                return result
+            except Exception as e:
+                if attempt == max_retries or isinstance(e, no_retry):
+                    try:
+                        return await self._handle_step_error(step, e, state)
+                    except Exception:
+                        if cancel is not None:
+                            cancel.set()
+                        raise
+                self.logger.warning(
+                    "Step %s failed (attempt %d), retrying: %s", step.name, attempt + 1, e
+                )
+                # Exponential backoff with jitter to avoid synchronized retries
+                await asyncio.sleep(delay * (2 ** attempt) + random.uniform(0, delay))
+    
+    async def _call(self, func: Callable, *args) -> Any:
+        """Await coroutine functions; run synchronous callables in a worker thread
+        so blocking work does not stall the event loop"""
+        if inspect.iscoroutinefunction(func):
+            return await func(*args)
+        result = await asyncio.to_thread(func, *args)
+        # Async callable objects, partials, mocks and lambdas returning
+        # coroutines are not detected as coroutine functions up front
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    
+    def _cache_key(self, step: PipelineStep, state: Mapping[str, Any],
+                   pipeline_id: str = "") -> bytes:
+        """Hash the pipeline, the step's function and its required inputs into a cache key
+        
+        Pipelines are never removed, so the step functions they hold stay
+        alive and their ids cannot be reused by other functions.
+        """
+        payload = orjson.dumps(
+            {
+                "p": pipeline_id,
+                "n": step.name,
+                "f": id(step.function),
+                "i": {req: state.get(req) for req in step.requires}
+            },
+            default=str,
+            option=_CACHE_KEY_OPTIONS
+        )
+        return hashlib.blake2b(payload).digest()
+    
+    def _store_result(self, cache_key: bytes, result: Any) -> None:
+        """Store a copy of a step result, evicting the least recently used entry"""
+        self._result_cache[cache_key] = copy.deepcopy(result)
+        self._result_cache.move_to_end(cache_key)
+        if len(self._result_cache) > self._result_cache_size:
+            self._result_cache.popitem(last=False)
+    
+    async def _handle_step_error(self, step: PipelineStep, error: Exception,
+                                 state: Mapping[str, Any]) -> Any:
+        """Give the step's error handlers a chance to recover from an error"""
+        for handler in step.error_handlers:
+            try:
+                result = await self._call(handler, error, state)
+            except Exception as handler_error:
+                self.logger.error("Error handler for step %s failed: %s", step.name, handler_error)
+                continue
+            if isinstance(result, dict):
+                return result
+        raise error
@@ -4,24 +4,139 @@ Implements security measures according to BSI and TÜV requirements
 """
 
 import os
+import hmac
+import time
+import heapq
+import atexit
+import struct
+import base64
 import logging
+import logging.handlers
+import queue
 import hashlib
 import secrets
-from typing import Dict, Any, Optional, List
+import threading
+import weakref
+import orjson
+from functools import partial
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterable, Iterator, FrozenSet
 from datetime import datetime
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.hmac import HMAC
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.x509 import load_pem_x509_certificate, load_der_x509_certificate
-from cryptography.x509.oid import NameOID
+from cryptography.x509.oid import ExtensionOID, ObjectIdentifier, SignatureAlgorithmOID
 from dataclasses import dataclass
-import jwt
-from jwt.exceptions import InvalidTokenError
 
 logger = logging.getLogger("GENXAIS.Security")
 
+def _b64url_encode(data: bytes) -> bytes:
+    """Unpadded base64url encoding as used by JWT"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+def _b64url_decode(data: bytes) -> bytes:
+    """Decode unpadded base64url"""
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+# Plaintext buffered per AES-GCM call in encrypt_stream, so OpenSSL's
+# pipelined AES-NI/PCLMULQDQ path runs on large blocks
+_STREAM_CHUNK_SIZE = 32768
+
+# BSI-compliant certificate signature algorithms
+_COMPLIANT_OIDS: FrozenSet[ObjectIdentifier] = frozenset({
+    SignatureAlgorithmOID.RSA_WITH_SHA256,
+    SignatureAlgorithmOID.RSA_WITH_SHA384,
+    SignatureAlgorithmOID.RSA_WITH_SHA512,
+    SignatureAlgorithmOID.ECDSA_WITH_SHA256,
+    SignatureAlgorithmOID.ECDSA_WITH_SHA384,
+    SignatureAlgorithmOID.ECDSA_WITH_SHA512
+})
+
+# Maps every ASCII character to its password character class (upper, lower,
+# digit, special), so an ASCII password is classified by one str.translate
+_PASSWORD_CLASSES = str.maketrans({
+    chr(i): ("U" if chr(i).isupper() else
+             "L" if chr(i).islower() else
+             "D" if chr(i).isdigit() else
+             "S" if not chr(i).isalnum() else "")
+    for i in range(128)
+})
+_REQUIRED_PASSWORD_CLASSES = frozenset("ULDS")
+
+# Process-invariant system info for audit records, refreshed in forked children
+_HOSTNAME = os.uname().nodename
+_PID = os.getpid()
+
+def _after_fork_in_child() -> None:
+    """Refresh the pid and drop session tokens pre-generated by the parent"""
+    global _PID
+    _PID = os.getpid()
+    for manager in list(_MANAGERS):
+        manager._token_pool = deque()
+        manager._token_lock = threading.Lock()
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
+# Audit events are serialized to canonical JSON; unknown types fall back to str
+_AUDIT_JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+# Encrypted audit records: fixed header (timestamp_ns, pid, level,
+# event type digest, user id digest, payload length) followed by the JSON
+# event. Records are batched and encrypted once per _AUDIT_BATCH_SIZE bytes.
+_AUDIT_RECORD = struct.Struct("<QIB16s16sI")
+_AUDIT_BATCH_SIZE = 32768
+
+# Audit records are written by one background listener shared by all managers
+_AUDIT_LISTENER: Optional[logging.handlers.QueueListener] = None
+_AUDIT_QUEUE: Optional[queue.SimpleQueue] = None
+_AUDIT_LISTENER_LOCK = threading.Lock()
+
+# Live managers, whose buffered audit records are flushed at exit and whose
+# token pools are reset in forked children; weak so that neither keeps
+# managers and their keys alive
+_MANAGERS: "weakref.WeakSet[SecurityManager]" = weakref.WeakSet()
+
+def _shutdown_audit_logging() -> None:
+    """Flush every live manager's audit records, then stop the listener"""
+    global _AUDIT_LISTENER, _AUDIT_QUEUE
+    for manager in list(_MANAGERS):
+        manager.flush_audit_log()
+    with _AUDIT_LISTENER_LOCK:
+        if _AUDIT_LISTENER is not None:
+            _AUDIT_LISTENER.stop()
+            _AUDIT_LISTENER = None
+            _AUDIT_QUEUE = None
+
+# Longest time flush_audit_log waits for the listener to catch up
+_AUDIT_DRAIN_TIMEOUT = 5.0
+
+class _AuditFileHandler(logging.FileHandler):
+    """Audit file handler that acknowledges drain markers instead of writing them"""
+    
+    def handle(self, record: logging.LogRecord) -> bool:
+        drained = getattr(record, "audit_drained", None)
+        if drained is not None:
+            # Everything enqueued before the marker has been written
+            self.flush()
+            drained.set()
+            return True
+        return super().handle(record)
+
+# Only HS256 tokens are issued, so the encoded header is constant
+_JWT_HEADER_B64 = _b64url_encode(b'{"alg":"HS256","typ":"JWT"}')
+
+# Session tokens are drawn from a pool refilled by one os.urandom call;
+# each token carries as much entropy as secrets.token_urlsafe(32)
+_SESSION_TOKEN_BYTES = 32
+_SESSION_TOKEN_POOL_SIZE = 256
+
+# Number of recently validated tokens whose claims are kept
+_TOKEN_CACHE_SIZE = 4096
+
 @dataclass
 class SecurityConfig:
     """Security configuration settings according to BSI requirements"""
@@ -33,6 +148,8 @@ class SecurityConfig:
     audit_retention_days: int = 365
     tls_min_version: str = "1.3"
     hash_algorithm: str = "SHA-512"
+    rsa_key_bits: int = 3072  # BSI minimum; keygen cost grows steeply with size
+    pbkdf2_iterations: int = 100000  # Stored hashes do not record the count
     encryption_algorithm: str = "AES-256-GCM"
     cert_validation_interval: int = 24  # Hours
     key_backup_interval: int = 7  # Days
@@ -45,10 +162,30 @@ class SecurityManager:
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize security manager"""
         self.config = SecurityConfig(**(config or {}))
+        # PBKDF2 parameters are fixed per manager; only password and salt vary
+        self._derive = partial(
+            hashlib.pbkdf2_hmac,
+            "sha512",
+            iterations=self.config.pbkdf2_iterations,
+            dklen=32
+        )
         self.fernet = self._init_encryption()
+        # Long-lived data key; re-keying AES-GCM per call dominated small payloads
+        self._bulk_key = AESGCM.generate_key(bit_length=256)
+        self._bulk_aead = AESGCM(self._bulk_key)
+        self._init_token_signing()
         self.audit_log = self._init_audit_logging()
+        # Pending encrypted-audit records and the highest level among them
+        self._audit_buf = bytearray()
+        self._audit_buf_level = logging.NOTSET
+        self._audit_lock = threading.Lock()
         self._failed_attempts = {}
         self._session_tokens = {}
+        # Min-heap of (monotonic expiry, token); may hold ended sessions
+        self._session_expiry = []
+        self._token_pool = deque()
+        self._token_lock = threading.Lock()
+        _MANAGERS.add(self)
         
     def _init_encryption(self) -> Fernet:
         """Initialize encryption"""
@@ -59,15 +196,43 @@ class SecurityManager:
             logger.error(f"Encryption initialization failed: {e}")
             raise
             
+    def _init_token_signing(self) -> None:
+        """Initialize the HS256 token signing key and HMAC template"""
+        self._signing_key = secrets.token_bytes(32)
+        # Copied per token so the key schedule is set up only once
+        self._jwt_hmac = HMAC(self._signing_key, hashes.SHA256())
+        # LRU of (expiry, claims JSON) of verified tokens keyed by a BLAKE2b
+        # digest of the token; hits parse a fresh copy, so callers cannot
+        # modify cached claims. Reset with the key so rotated-out tokens are
+        # not accepted
+        self._token_cache: OrderedDict = OrderedDict()
+            
+    def _sign_token(self, signing_input: bytes) -> bytes:
+        """Compute the HS256 signature of a token's header and payload"""
+        h = self._jwt_hmac.copy()
+        h.update(signing_input)
+        return h.finalize()
+            
     def _init_audit_logging(self) -> logging.Logger:
-        """Initialize audit logging"""
+        """Initialize audit logging
+        
+        Records are enqueued by the caller and written to disk by a
+        background QueueListener, so security operations never block on I/O.
+        """
+        global _AUDIT_LISTENER, _AUDIT_QUEUE
         audit_logger = logging.getLogger("GENXAIS.Security.Audit")
-        handler = logging.FileHandler("logs/security_audit.log")
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        audit_logger.addHandler(handler)
+        with _AUDIT_LISTENER_LOCK:
+            if _AUDIT_LISTENER is None:
+                handler = _AuditFileHandler("logs/security_audit.log")
+                formatter = logging.Formatter(
+                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+                )
+                handler.setFormatter(formatter)
+                audit_queue = _AUDIT_QUEUE = queue.SimpleQueue()
+                _AUDIT_LISTENER = logging.handlers.QueueListener(audit_queue, handler)
+                _AUDIT_LISTENER.start()
+                atexit.register(_shutdown_audit_logging)
+                audit_logger.addHandler(logging.handlers.QueueHandler(audit_queue))
         audit_logger.setLevel(logging.INFO)
         return audit_logger
         
@@ -76,7 +241,7 @@ class SecurityManager:
         try:
             private_key = rsa.generate_private_key(
                 public_exponent=65537,
-                key_size=4096
+                key_size=self.config.rsa_key_bits
             )
             public_key = private_key.public_key()
             return private_key, public_key
@@ -84,23 +249,44 @@ class SecurityManager:
             logger.error(f"Key pair generation failed: {e}")
             raise
             
-    def encrypt_data(self, data: bytes) -> bytes:
-        """Encrypt data using AES-256-GCM"""
+    def encrypt_data(self, data: bytes, aad: Optional[bytes] = None) -> bytes:
+        """Encrypt data using AES-256-GCM with the manager's data key
+        
+        Returns the 12-byte nonce followed by the ciphertext and tag.
+        """
         try:
-            key = AESGCM.generate_key(bit_length=256)
-            aesgcm = AESGCM(key)
             nonce = os.urandom(12)
-            return aesgcm.encrypt(nonce, data, None)
+            return nonce + self._bulk_aead.encrypt(nonce, data, aad)
         except Exception as e:
             logger.error(f"Data encryption failed: {e}")
             raise
             
-    def decrypt_data(self, encrypted_data: bytes, key: bytes) -> bytes:
-        """Decrypt data using AES-256-GCM"""
+    def encrypt_stream(self, chunks: Iterable[bytes],
+                       aad: Optional[bytes] = None) -> Iterator[bytes]:
+        """Encrypt a stream of chunks using AES-256-GCM
+        
+        Small chunks are coalesced into buffers of at least 32 KiB before
+        encryption. Each yielded record is in the encrypt_data format.
+        """
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) >= _STREAM_CHUNK_SIZE:
+                yield self.encrypt_data(bytes(buffer), aad)
+                buffer.clear()
+        if buffer:
+            yield self.encrypt_data(bytes(buffer), aad)
+            
+    def decrypt_data(self, encrypted_data: bytes, key: Optional[bytes] = None,
+                     aad: Optional[bytes] = None) -> bytes:
+        """Decrypt data using AES-256-GCM
+        
+        Uses the manager's data key unless another key is given.
+        """
         try:
-            aesgcm = AESGCM(key)
+            aesgcm = AESGCM(key) if key is not None else self._bulk_aead
             nonce = encrypted_data[:12]
-            return aesgcm.decrypt(nonce, encrypted_data[12:], None)
+            return aesgcm.decrypt(nonce, encrypted_data[12:], aad)
         except Exception as e:
             logger.error(f"Data decryption failed: {e}")
             raise
@@ -109,53 +295,63 @@ class SecurityManager:
         """Hash password using PBKDF2 with SHA-512"""
         try:
             salt = os.urandom(16)
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA512(),
-                length=32,
-                salt=salt,
-                iterations=100000
+            key = self._derive(password.encode(), salt)
+            return (
+                base64.urlsafe_b64encode(salt).decode()
+                + "$"
+                + base64.urlsafe_b64encode(key).decode()
             )
-            key = kdf.derive(password.encode())
-            return f"{salt.hex()}:{key.hex()}"
         except Exception as e:
             logger.error(f"Password hashing failed: {e}")
             raise
             
+    def hash_passwords_batch(self, passwords: List[str]) -> List[str]:
+        """Hash many passwords in parallel
+        
+        hashlib releases the GIL for the whole PBKDF2 derivation, so the
+        hashes are computed on all cores.
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(self.hash_password, passwords))
+            
     def verify_password(self, password: str, hash_str: str) -> bool:
-        """Verify password against hash"""
+        """Verify password against hash
+        
+        Accepts the base64 "salt$key" format and the legacy hex "salt:key".
+        """
         try:
-            salt_hex, key_hex = hash_str.split(":")
-            salt = bytes.fromhex(salt_hex)
-            key = bytes.fromhex(key_hex)
-            
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA512(),
-                length=32,
-                salt=salt,
-                iterations=100000
-            )
-            
-            kdf.verify(password.encode(), key)
-            return True
-        except Exception:
+            salt_b64, sep, key_b64 = hash_str.partition("$")
+            if sep:
+                salt = base64.urlsafe_b64decode(salt_b64)
+                key = base64.urlsafe_b64decode(key_b64)
+            else:
+                salt_hex, sep, key_hex = hash_str.partition(":")
+                if not sep:
+                    return False
+                salt = bytes.fromhex(salt_hex)
+                key = bytes.fromhex(key_hex)
+            secret = password.encode()
+        except (ValueError, TypeError, AttributeError):
+            # Malformed hashes and non-str inputs never verify
             return False
+        
+        derived = self._derive(secret, salt)
+        # A wrong password is a plain False, not an exception
+        return hmac.compare_digest(derived, key)
             
     def generate_token(self, user_id: str, roles: List[str]) -> str:
         """Generate JWT token"""
         try:
+            now = int(time.time())
             payload = {
                 "sub": user_id,
                 "roles": roles,
-                "iat": datetime.utcnow(),
-                "exp": datetime.utcnow().timestamp() + (
-                    self.config.session_timeout_minutes * 60
-                )
+                "iat": now,
+                "exp": now + self.config.session_timeout_minutes * 60
             }
-            return jwt.encode(
-                payload,
-                self.fernet.encryption_key,
-                algorithm="HS256"
-            )
+            signing_input = _JWT_HEADER_B64 + b"." + _b64url_encode(orjson.dumps(payload))
+            signature = _b64url_encode(self._sign_token(signing_input))
+            return (signing_input + b"." + signature).decode()
         except Exception as e:
             logger.error(f"Token generation failed: {e}")
             raise
@@ -163,12 +359,35 @@ class SecurityManager:
     def validate_token(self, token: str) -> Dict[str, Any]:
         """Validate JWT token"""
         try:
-            return jwt.decode(
-                token,
-                self.fernet.encryption_key,
-                algorithms=["HS256"]
-            )
-        except InvalidTokenError as e:
+            cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+            cached = self._token_cache.get(cache_key)
+            if cached is not None:
+                exp, raw_claims = cached
+                if exp > time.time():
+                    self._token_cache.move_to_end(cache_key)
+                    return orjson.loads(raw_claims)
+                del self._token_cache[cache_key]
+                raise ValueError("Signature has expired")
+            
+            header, payload, signature = token.encode().split(b".")
+            if header != _JWT_HEADER_B64:
+                raise ValueError("Unsupported token header")
+            expected = self._sign_token(header + b"." + payload)
+            if not hmac.compare_digest(expected, _b64url_decode(signature)):
+                raise ValueError("Signature verification failed")
+            
+            raw_claims = _b64url_decode(payload)
+            claims = orjson.loads(raw_claims)
+            if not isinstance(claims, dict):
+                raise ValueError("Invalid token payload")
+            if claims.get("exp", 0) <= time.time():
+                raise ValueError("Signature has expired")
+            
+            self._token_cache[cache_key] = (claims["exp"], raw_claims)
+            if len(self._token_cache) > _TOKEN_CACHE_SIZE:
+                self._token_cache.popitem(last=False)
+            return claims
+        except (ValueError, TypeError, AttributeError) as e:
             logger.warning(f"Token validation failed: {e}")
             return {}
             
@@ -176,13 +395,24 @@ class SecurityManager:
         """Check password strength"""
         if len(password) < self.config.password_min_length:
             return False
-            
-        has_upper = any(c.isupper() for c in password)
-        has_lower = any(c.islower() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(not c.isalnum() for c in password)
         
-        return all([has_upper, has_lower, has_digit, has_special])
+        if password.isascii():
+            return _REQUIRED_PASSWORD_CLASSES <= set(password.translate(_PASSWORD_CLASSES))
+            
+        # Non-ASCII: single pass, stopping once every class has been seen
+        missing = 0b1111
+        for c in password:
+            if c.isupper():
+                missing &= ~0b0001
+            elif c.islower():
+                missing &= ~0b0010
+            elif c.isdigit():
+                missing &= ~0b0100
+            elif not c.isalnum():
+                missing &= ~0b1000
+            if not missing:
+                return True
+        return False
         
     def log_security_event(
         self,
@@ -192,16 +422,18 @@ class SecurityManager:
     ) -> None:
         """Log security event"""
         try:
+            level = getattr(logging, severity)
+            # Filtered-out events are not built or serialized at all
+            if not self.audit_log.isEnabledFor(level):
+                return
             event = {
                 "timestamp": datetime.utcnow().isoformat(),
                 "event_type": event_type,
                 "severity": severity,
                 "details": details
             }
-            self.audit_log.log(
-                getattr(logging, severity),
-                f"Security Event: {event}"
-            )
+            payload = orjson.dumps(event, default=str, option=_AUDIT_JSON_OPTIONS)
+            self.audit_log.log(level, "Security Event: %s", payload.decode())
         except Exception as e:
             logger.error(f"Event logging failed: {e}")
             
@@ -226,16 +458,15 @@ class SecurityManager:
     def handle_failed_login(self, user_id: str) -> bool:
         """Handle failed login attempt"""
         try:
-            if user_id not in self._failed_attempts:
-                self._failed_attempts[user_id] = {
-                    "count": 0,
-                    "last_attempt": datetime.utcnow()
-                }
+            attempts = self._failed_attempts.get(user_id)
+            if attempts is None:
+                attempts = self._failed_attempts[user_id] = {"count": 0}
                 
-            self._failed_attempts[user_id]["count"] += 1
-            self._failed_attempts[user_id]["last_attempt"] = datetime.utcnow()
+            attempts["count"] += 1
+            # Monotonic seconds; only compared, never displayed
+            attempts["last_attempt"] = time.monotonic()
             
-            if self._failed_attempts[user_id]["count"] >= self.config.max_login_attempts:
+            if attempts["count"] >= self.config.max_login_attempts:
                 self.log_security_event(
                     "account_locked",
                     {"user_id": user_id},
@@ -250,39 +481,49 @@ class SecurityManager:
             
     def reset_failed_attempts(self, user_id: str) -> None:
         """Reset failed login attempts"""
-        try:
-            if user_id in self._failed_attempts:
-                del self._failed_attempts[user_id]
-        except Exception as e:
-            logger.error(f"Failed attempts reset failed: {e}")
+        self._failed_attempts.pop(user_id, None)
             
     def validate_session(self, token: str) -> bool:
         """Validate session token"""
-        try:
-            if token not in self._session_tokens:
-                return False
-                
-            session = self._session_tokens[token]
-            if (datetime.utcnow() - session["created"]).total_seconds() > (
-                self.config.session_timeout_minutes * 60
-            ):
-                del self._session_tokens[token]
-                return False
-                
-            return True
-        except Exception as e:
-            logger.error(f"Session validation failed: {e}")
+        session = self._session_tokens.get(token)
+        if session is None:
+            return False
+            
+        if time.monotonic() > session["expires"]:
+            del self._session_tokens[token]
             return False
             
+        return True
+            
+    def _next_session_token(self) -> str:
+        """Take a session token from the pool, refilling it when empty"""
+        try:
+            return self._token_pool.popleft()
+        except IndexError:
+            pass
+        with self._token_lock:
+            if not self._token_pool:
+                raw = os.urandom(_SESSION_TOKEN_BYTES * _SESSION_TOKEN_POOL_SIZE)
+                self._token_pool.extend(
+                    _b64url_encode(raw[i:i + _SESSION_TOKEN_BYTES]).decode()
+                    for i in range(0, len(raw), _SESSION_TOKEN_BYTES)
+                )
+            return self._token_pool.popleft()
+            
     def create_session(self, user_id: str, roles: List[str]) -> str:
         """Create new session"""
         try:
-            token = secrets.token_urlsafe(32)
+            token = self._next_session_token()
+            # Monotonic seconds, cheaper than datetime and immune to clock jumps
+            created = time.monotonic()
+            expires = created + self.config.session_timeout_minutes * 60
             self._session_tokens[token] = {
                 "user_id": user_id,
                 "roles": roles,
-                "created": datetime.utcnow()
+                "created": created,
+                "expires": expires
             }
+            heapq.heappush(self._session_expiry, (expires, token))
             return token
         except Exception as e:
             logger.error(f"Session creation failed: {e}")
@@ -290,38 +531,29 @@ class SecurityManager:
             
     def end_session(self, token: str) -> bool:
         """End session"""
-        try:
-            if token in self._session_tokens:
-                del self._session_tokens[token]
-                return True
-            return False
-        except Exception as e:
-            logger.error(f"Session end failed: {e}")
-            return False
+        return self._session_tokens.pop(token, None) is not None
             
     def cleanup_expired_sessions(self) -> None:
-        """Clean up expired sessions"""
-        try:
-            current_time = datetime.utcnow()
-            expired_tokens = [
-                token for token, session in self._session_tokens.items()
-                if (current_time - session["created"]).total_seconds() > (
-                    self.config.session_timeout_minutes * 60
-                )
-            ]
-            
-            for token in expired_tokens:
+        """Clean up expired sessions
+        
+        Only the expired prefix of the expiry heap is visited.
+        """
+        now = time.monotonic()
+        expiry = self._session_expiry
+        while expiry and expiry[0][0] < now:
+            expires, token = heapq.heappop(expiry)
+            session = self._session_tokens.get(token)
+            # Skip entries of sessions that already ended
+            if session is not None and session["expires"] == expires:
                 del self._session_tokens[token]
-                
-        except Exception as e:
-            logger.error(f"Session cleanup failed: {e}")
             
     def rotate_encryption_keys(self) -> None:
         """Rotate encryption keys"""
         try:
             new_key = Fernet.generate_key()
-            old_key = self.fernet.encryption_key
             self.fernet = Fernet(new_key)
+            # Tokens signed with the previous key become invalid
+            self._init_token_signing()
             
             # Re-encrypt sensitive data with new key
             # Implementation depends on specific data storage
@@ -351,7 +583,7 @@ class SecurityManager:
             # Check key usage
             try:
                 key_usage = cert.extensions.get_extension_for_oid(
-                    NameOID.KEY_USAGE
+                    ExtensionOID.KEY_USAGE
                 ).value
                 if not key_usage.digital_signature:
                     logger.warning("Certificate key usage check failed")
@@ -361,7 +593,7 @@ class SecurityManager:
                 return False
             
             # Check algorithm compliance
-            if cert.signature_algorithm_oid not in self.get_compliant_algorithms():
+            if cert.signature_algorithm_oid not in _COMPLIANT_OIDS:
                 logger.warning("Certificate uses non-compliant algorithm")
                 return False
             
@@ -374,6 +606,17 @@ class SecurityManager:
             logger.error(f"Certificate validation failed: {e}")
             return False
         
+    def validate_certificates(self, certs: List[bytes], is_pem: bool = True) -> List[bool]:
+        """Validate many X.509 certificates in parallel
+        
+        Parsing and key checks run in OpenSSL with the GIL released, so
+        the certificates are validated on all cores.
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(
+                partial(self.validate_certificate, is_pem=is_pem), certs
+            ))
+        
     def check_bsi_requirements(self, cert) -> bool:
         """Additional BSI-specific certificate checks"""
         try:
@@ -393,16 +636,9 @@ class SecurityManager:
             logger.error(f"BSI requirement check failed: {e}")
             return False
         
-    def get_compliant_algorithms(self) -> List[str]:
-        """Get BSI-compliant algorithms"""
-        return [
-            "sha256WithRSAEncryption",
-            "sha384WithRSAEncryption",
-            "sha512WithRSAEncryption",
-            "ecdsa-with-SHA256",
-            "ecdsa-with-SHA384",
-            "ecdsa-with-SHA512"
-        ]
+    def get_compliant_algorithms(self) -> FrozenSet[ObjectIdentifier]:
+        """Get BSI-compliant signature algorithm OIDs"""
+        return _COMPLIANT_OIDS
     
     def backup_crypto_keys(self) -> None:
         """Backup cryptographic keys according to BSI requirements"""
@@ -458,27 +694,80 @@ class SecurityManager:
                 "system_info": self.get_system_info()
             }
             
-            # Encrypt audit log if required
-            if self.config.audit_log_encryption:
-                event = self.encrypt_data(str(event).encode())
+            payload = orjson.dumps(event, default=str, option=_AUDIT_JSON_OPTIONS)
+            level = getattr(logging, severity)
+            severe = severity in ["WARNING", "ERROR", "CRITICAL"]
             
-            self.audit_log.log(
-                getattr(logging, severity),
-                f"Security Event: {event}"
-            )
+            # Encrypt audit log if required; records are batched so one
+            # AES-GCM call covers many events
+            if self.config.audit_log_encryption:
+                header = _AUDIT_RECORD.pack(
+                    time.time_ns(),
+                    _PID,
+                    level,
+                    hashlib.blake2b(event_type.encode(), digest_size=16).digest(),
+                    hashlib.blake2b((user_id or "").encode(), digest_size=16).digest(),
+                    len(payload)
+                )
+                with self._audit_lock:
+                    self._audit_buf += header + payload
+                    self._audit_buf_level = max(self._audit_buf_level, level)
+                    full = len(self._audit_buf) >= _AUDIT_BATCH_SIZE
+                # Severe events are written out immediately
+                if severe or full:
+                    self.flush_audit_log()
+            else:
+                self.audit_log.log(level, "Security Event: %s", payload.decode())
             
             # Additional BSI required logging
-            if severity in ["WARNING", "ERROR", "CRITICAL"]:
+            if severe:
                 self.notify_security_team(event)
         except Exception as e:
             logger.error(f"Enhanced audit logging failed: {e}")
         
+    def flush_audit_log(self) -> None:
+        """Write out pending audit records
+        
+        Encrypts buffered records as one batch and waits until the background
+        listener has written every queued record to disk.
+        """
+        with self._audit_lock:
+            records, self._audit_buf = self._audit_buf, bytearray()
+            level, self._audit_buf_level = self._audit_buf_level, logging.NOTSET
+            
+        if records:
+            try:
+                batch = self.encrypt_data(bytes(records))
+                self.audit_log.log(
+                    level,
+                    f"Security Event Batch: {base64.b64encode(batch).decode()}"
+                )
+            except Exception as e:
+                logger.error(f"Audit log flush failed, keeping records for the next flush: {e}")
+                # Put the records back ahead of any appended since the swap
+                with self._audit_lock:
+                    self._audit_buf[:0] = records
+                    self._audit_buf_level = max(self._audit_buf_level, level)
+        
+        audit_queue = _AUDIT_QUEUE
+        if audit_queue is None:
+            # Listener already shut down at exit
+            return
+            
+        # The listener handles records in order, so once it reaches this
+        # marker every earlier record is on disk. The marker goes straight
+        # onto the queue so it never reaches other (e.g. root) handlers.
+        drained = threading.Event()
+        audit_queue.put(logging.makeLogRecord({"audit_drained": drained}))
+        if not drained.wait(_AUDIT_DRAIN_TIMEOUT):
+            logger.error("Audit log flush timed out waiting for the audit listener")
+        
     def get_system_info(self) -> Dict[str, Any]:
         """Get system information for audit logging"""
         return {
-            "hostname": os.uname().nodename,
+            "hostname": _HOSTNAME,
             "timestamp": datetime.utcnow().isoformat(),
-            "process_id": os.getpid()
+            "process_id": _PID
         }
         
     def notify_security_team(self, event: Dict[str, Any]) -> None:
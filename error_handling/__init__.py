@@ -2,6 +2,6 @@
 GENXAIS Framework - Error Handling Module
 """
 
-from .framework import SDKErrorHandler, safe_execute
+from .framework import ErrorDoc, SDKErrorHandler, safe_execute
 
-__all__ = ['SDKErrorHandler', 'safe_execute'] 
\ No newline at end of file
+__all__ = ['ErrorDoc', 'SDKErrorHandler', 'safe_execute'] 
\ No newline at end of file
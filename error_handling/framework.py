@@ -4,13 +4,161 @@ PREVENTS UNNECESSARY OVERWRITES - EXTENDS ONLY CAREFULLY
 """
 
 import os
+import re
 import sys
-import json
+import time
+import hashlib
+import queue
+import atexit
+import shutil
 import logging
+import logging.handlers
+import threading
+import orjson
+from functools import lru_cache
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, FrozenSet, Union
 from datetime import datetime
-import traceback
+
+# Error documentation is buffered and written as one NDJSON file per batch,
+# once the batch is full or the oldest buffered doc is this many seconds old
+ERROR_DOC_DIR = "logs/error_docs"
+ERROR_DOC_BATCH_SIZE = 64
+ERROR_DOC_FLUSH_INTERVAL = 5.0
+
+# Error docs are NDJSON; details may carry non-string keys and arbitrary objects
+_DOC_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+
+# Identical errors (same type and details) within this many seconds are
+# collapsed into the first occurrence's result and one aggregated doc
+ERROR_DEDUP_WINDOW = 10.0
+_MAX_RECENT_ERRORS = 1024
+
+# Error types without a recovery strategy are fully documented once; later
+# occurrences are only counted and written as one aggregated record per type
+# once this many accumulated or this many seconds passed
+UNKNOWN_ERROR_FLUSH_COUNT = 100
+UNKNOWN_ERROR_FLUSH_INTERVAL = 30.0
+
+# Missing modules are installed with one pip run per batch, started this many
+# seconds after the first request or as soon as the batch is full
+IMPORT_BATCH_DELAY = 0.25
+IMPORT_BATCH_SIZE = 8
+
+# Background thread writing all log records; created by the first handler
+_LOG_LISTENER: Optional[logging.handlers.QueueListener] = None
+_LOG_LISTENER_LOCK = threading.Lock()
+
+# API key assignments in .env files: KEY=value lines that are not comments
+# and whose key contains API or KEY
+_ENV_KEY_RE = re.compile(
+    rb"^(?!#)[ \t]*([^=\n]*(?:API|KEY)[^=\n]*)=(.*)$",
+    re.MULTILINE | re.IGNORECASE
+)
+
+# Alternative locations searched for missing files
+FILE_SEARCH_PATHS = (
+    ".",
+    "genxais",
+    "backend",
+    "src",
+    "scripts",
+    "../genxais",
+    "apm_framework"
+)
+
+# Shared handler used by safe_execute, created on first use
+_HANDLER: Optional["SDKErrorHandler"] = None
+_HANDLER_LOCK = threading.Lock()
+
+# Directory listings by absolute path, as (st_mtime_ns, entry names); a
+# listing is reused until the directory changes
+_DIR_LISTINGS: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+_DIR_LISTINGS_MAX = 256
+
+def _list_dir(path: str) -> FrozenSet[str]:
+    """Lists a directory's entry names (empty if missing), with one stat per cached call."""
+    
+    path = os.path.abspath(path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return frozenset()
+    cached = _DIR_LISTINGS.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    try:
+        with os.scandir(path) as entries:
+            names = frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+    if len(_DIR_LISTINGS) >= _DIR_LISTINGS_MAX:
+        _DIR_LISTINGS.clear()
+    _DIR_LISTINGS[path] = (mtime_ns, names)
+    return names
+
+
+def _locate_file(filename: str, search_paths: Tuple[str, ...]) -> Optional[str]:
+    """Finds a file in the search paths, relative ones resolved against the current directory."""
+    
+    for search_path in search_paths:
+        if filename in _list_dir(search_path):
+            return os.path.join(search_path, filename)
+    return None
+
+
+@lru_cache(maxsize=1)
+def _installed_packages() -> set:
+    """Normalized names of installed distributions and the top-level modules they provide (mutable, cached)."""
+    import importlib.metadata
+    installed = {
+        _normalize_package(dist.metadata["Name"])
+        for dist in importlib.metadata.distributions()
+        if dist.metadata["Name"]
+    }
+    installed.update(importlib.metadata.packages_distributions())
+    return installed
+
+
+def _normalize_package(name: str) -> str:
+    """PEP 503 normalization, so "Foo_Bar" and "foo-bar" compare equal."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _atomic_write(path: str, data: bytes):
+    """Writes data to a temp file next to path and renames it into place, so readers never see a partial file."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def _invalidate_file_index():
+    """Forgets cached directory listings."""
+    
+    _DIR_LISTINGS.clear()
+
+
+@dataclass(slots=True)
+class ErrorDoc:
+    """Documentation of one handled error, serialized natively by orjson."""
+    timestamp: str
+    error_type: str
+    error_details: Dict[str, Any]
+    context: str
+    stack_trace: Optional[str] = None
+    recovery_attempted: bool = False
+    recovery_successful: bool = False
+    recovery_details: Optional[Dict[str, Any]] = None
+    recovery_error: Optional[str] = None
+
 
 class SDKErrorHandler:
     """
@@ -21,23 +169,74 @@ class SDKErrorHandler:
     def __init__(self):
         self.error_log_file = "logs/sdk_errors.log"
         self.recovery_strategies = {}
+        # Directories known to exist, so repeated writes skip the mkdir syscall
+        self._ensured_dirs: set = set()
+        self._ensure_dir(ERROR_DOC_DIR)
+        self._error_buffer: List[Union[ErrorDoc, Dict[str, Any]]] = []
+        self._buffer_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._pending_imports: set = set()
+        self._import_lock = threading.Lock()
+        self._import_flush_timer: Optional[threading.Timer] = None
+        # uv starts in milliseconds, pip pays interpreter and import startup per run
+        uv = shutil.which("uv")
+        if uv:
+            self._pip_install = [uv, "pip", "install", "--python", sys.executable]
+        else:
+            self._pip_install = [sys.executable, "-m", "pip", "install",
+                                 "--no-input", "--disable-pip-version-check"]
+        # error key -> [first seen (monotonic), suppressed duplicates, result, error type]
+        self._recent_errors: Dict[bytes, list] = {}
+        # error type -> occurrences since the last aggregated record
+        self._unknown_counts: Dict[str, int] = {}
+        self._unknown_flushed_at = time.monotonic()
         self.setup_logging()
+        # atexit runs handlers last in, first out: registered after the log
+        # listener's stop, the final flushes still reach the log files
+        atexit.register(self._flush)
+        atexit.register(self._flush_duplicates)
+        atexit.register(self._flush_unknown)
         self.setup_recovery_strategies()
         
+    def _ensure_dir(self, path: str):
+        """Creates a directory (and its parents) unless it was ensured before."""
+        
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+            
     def setup_logging(self):
         """Initializes robust logging system."""
         
+        global _LOG_LISTENER
+        
         # Create logs directory if it doesn't exist
-        os.makedirs("logs", exist_ok=True)
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.error_log_file, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
+        self._ensure_dir(os.path.dirname(self.error_log_file))
+        
+        # Like logging.basicConfig, only configure an unconfigured root logger.
+        # Callers just enqueue records; file and console writes happen on the
+        # listener thread, off the error handling path.
+        with _LOG_LISTENER_LOCK:
+            root_logger = logging.getLogger()
+            if _LOG_LISTENER is None and not root_logger.handlers:
+                formatter = logging.Formatter(
+                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+                )
+                file_handler = logging.FileHandler(self.error_log_file, encoding='utf-8')
+                stream_handler = logging.StreamHandler()
+                file_handler.setFormatter(formatter)
+                stream_handler.setFormatter(formatter)
+                
+                log_queue = queue.SimpleQueue()
+                _LOG_LISTENER = logging.handlers.QueueListener(
+                    log_queue, file_handler, stream_handler
+                )
+                _LOG_LISTENER.start()
+                atexit.register(_LOG_LISTENER.stop)
+                
+                root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+                root_logger.setLevel(logging.INFO)
+        self._listener = _LOG_LISTENER
         
         self.logger = logging.getLogger("SDK_ErrorHandler")
         self.logger.info("🛡️ SDK Error Handler initialized")
@@ -60,45 +259,124 @@ class SDKErrorHandler:
         """
         Central error handling with recovery strategies.
         IMPORTANT: NEVER OVERWRITE CODE - ONLY EXTEND!
+        
+        Repeats of an error within ERROR_DEDUP_WINDOW seconds return the
+        first occurrence's result without recovery, logging or documentation.
         """
         
+        now = time.monotonic()
+        key = hashlib.blake2b(
+            f"{error_type}|{sorted(map(repr, error_details.items()))}".encode(),
+            digest_size=16
+        ).digest()
+        
+        entry = self._recent_errors.get(key)
+        if entry is not None and now - entry[0] < ERROR_DEDUP_WINDOW:
+            entry[1] += 1
+            return entry[2]
+            
+        # One wall-clock reading per error event, shared by all docs it produces
+        timestamp = datetime.now().isoformat(timespec='microseconds')
+        if entry is not None:
+            self._save_duplicates(self._recent_errors.pop(key), timestamp)
+        elif len(self._recent_errors) >= _MAX_RECENT_ERRORS:
+            self._flush_duplicates(expired_before=now - ERROR_DEDUP_WINDOW, timestamp=timestamp)
+            
+        result = self._process_error(error_type, error_details, context, timestamp)
+        self._recent_errors[key] = [now, 0, result, error_type]
+        return result
+        
+    def _save_duplicates(self, entry: list, timestamp: str):
+        """Documents how often a deduplicated error was suppressed."""
+        
+        if entry[1]:
+            self.save_error_documentation({
+                "timestamp": timestamp,
+                "error_type": entry[3],
+                "count": entry[1] + 1,
+                "window_s": ERROR_DEDUP_WINDOW,
+                "aggregated": True
+            })
+            
+    def _flush_duplicates(self, expired_before: Optional[float] = None, timestamp: Optional[str] = None):
+        """Drops deduplication entries (all, or those older than a cutoff), documenting suppressed repeats."""
+        
+        timestamp = timestamp or datetime.now().isoformat(timespec='microseconds')
+        for key, entry in list(self._recent_errors.items()):
+            if expired_before is None or entry[0] < expired_before:
+                del self._recent_errors[key]
+                self._save_duplicates(entry, timestamp)
+        
+    def _flush_unknown(self, timestamp: Optional[str] = None):
+        """Writes one aggregated record per error type counted without a recovery strategy."""
+        
+        self._unknown_flushed_at = time.monotonic()
+        timestamp = timestamp or datetime.now().isoformat(timespec='microseconds')
+        for error_type, count in self._unknown_counts.items():
+            if count:
+                # Keep the type so it is not fully documented again
+                self._unknown_counts[error_type] = 0
+                self.save_error_documentation({
+                    "timestamp": timestamp,
+                    "error_type": error_type,
+                    "count": count,
+                    "no_strategy": True,
+                    "aggregated": True
+                })
+                
+    def _process_error(self, error_type: str, error_details: Dict[str, Any], context: str,
+                       timestamp: str) -> Dict[str, Any]:
+        """Runs recovery and documentation for one error occurrence."""
+        
+        strategy = self.recovery_strategies.get(error_type)
+        if strategy is None and error_type in self._unknown_counts:
+            # Already documented once: count it, skip traceback and disk write
+            count = self._unknown_counts[error_type] = self._unknown_counts[error_type] + 1
+            self.logger.debug(f"No recovery strategy for: {error_type} ({count} pending)")
+            if count >= UNKNOWN_ERROR_FLUSH_COUNT or \
+                    time.monotonic() - self._unknown_flushed_at >= UNKNOWN_ERROR_FLUSH_INTERVAL:
+                self._flush_unknown(timestamp)
+            return {
+                "status": "no_strategy",
+                "error_doc": ErrorDoc(timestamp, error_type, error_details, context)
+            }
+            
         self.logger.error(f"🚨 Error detected: {error_type}")
         self.logger.error(f"📋 Details: {error_details}")
         self.logger.error(f"🔍 Context: {context}")
         
+        # Only format a stack trace when called while handling an exception
+        stack_trace = None
+        if sys.exc_info()[0] is not None:
+            import traceback
+            stack_trace = traceback.format_exc()
+        
         # Document error comprehensively
-        error_doc = {
-            "timestamp": datetime.now().isoformat(),
-            "error_type": error_type,
-            "error_details": error_details,
-            "context": context,
-            "stack_trace": traceback.format_exc(),
-            "recovery_attempted": False,
-            "recovery_successful": False
-        }
+        error_doc = ErrorDoc(timestamp, error_type, error_details, context, stack_trace)
         
         try:
             # Attempt recovery strategy
-            if error_type in self.recovery_strategies:
+            if strategy is not None:
                 self.logger.info(f"🔧 Starting recovery strategy for: {error_type}")
-                error_doc["recovery_attempted"] = True
+                error_doc.recovery_attempted = True
                 
-                recovery_result = self.recovery_strategies[error_type](error_details, context)
+                recovery_result = strategy(error_details, context)
                 
                 if recovery_result.get("success", False):
-                    error_doc["recovery_successful"] = True
-                    error_doc["recovery_details"] = recovery_result
+                    error_doc.recovery_successful = True
+                    error_doc.recovery_details = recovery_result
                     self.logger.info(f"✅ Recovery successful: {error_type}")
                     return {"status": "recovered", "details": recovery_result}
                 else:
                     self.logger.warning(f"⚠️ Recovery failed: {error_type}")
-                    error_doc["recovery_details"] = recovery_result
+                    error_doc.recovery_details = recovery_result
             else:
                 self.logger.warning(f"❌ No recovery strategy for: {error_type}")
+                self._unknown_counts[error_type] = 0
                 
         except Exception as recovery_error:
             self.logger.error(f"💥 Recovery error: {str(recovery_error)}")
-            error_doc["recovery_error"] = str(recovery_error)
+            error_doc.recovery_error = str(recovery_error)
             
         # Save error documentation
         self.save_error_documentation(error_doc)
@@ -118,13 +396,11 @@ class SDKErrorHandler:
             if os.path.exists(env_file):
                 self.logger.info(f"📁 Checking {env_file}...")
                 try:
-                    with open(env_file, 'r') as f:
-                        for line in f:
-                            if '=' in line and not line.startswith('#'):
-                                key, value = line.strip().split('=', 1)
-                                if 'API' in key.upper() or 'KEY' in key.upper():
-                                    found_keys[key] = value
-                                    self.logger.info(f"🔑 Found: {key}")
+                    data = Path(env_file).read_bytes()
+                    for match in _ENV_KEY_RE.finditer(data):
+                        key = match.group(1).decode()
+                        found_keys[key] = match.group(2).strip().decode()
+                        self.logger.info(f"🔑 Found: {key}")
                 except Exception as e:
                     self.logger.warning(f"⚠️ Error reading {env_file}: {e}")
         
@@ -177,27 +453,22 @@ ML_SERVICE_API_KEY=your_ml_key_here
         self.logger.info(f"📁 Attempting recovery of: {missing_file}")
         
         # 1. Search in alternative paths
-        search_paths = [
-            ".",
-            "genxais",
-            "backend",
-            "src",
-            "scripts",
-            "../genxais",
-            "apm_framework"
-        ]
-        
         filename = os.path.basename(missing_file)
+        potential_path = _locate_file(filename, FILE_SEARCH_PATHS)
         
-        for search_path in search_paths:
-            potential_path = os.path.join(search_path, filename)
-            if os.path.exists(potential_path):
-                self.logger.info(f"✅ File found in: {potential_path}")
-                return {
-                    "success": True,
-                    "found_path": potential_path,
-                    "message": f"File found in {potential_path}"
-                }
+        if potential_path is not None:
+            self.logger.info(f"✅ File found in: {potential_path}")
+            return {
+                "success": True,
+                "found_path": potential_path,
+                "message": f"File found in {potential_path}"
+            }
+            
+        return {
+            "success": False,
+            "message": f"File not found in search paths: {filename}",
+            "required_action": "Restore the file or create it"
+        }
 
     def create_minimal_python_file(self, file_path: str) -> Dict[str, Any]:
         """Creates a minimal Python file with basic structure."""
@@ -217,8 +488,8 @@ def main():
 if __name__ == "__main__":
     main()
 '''
-            with open(file_path, 'w') as f:
-                f.write(minimal_content)
+            _atomic_write(file_path, minimal_content.encode())
+            _invalidate_file_index()
                 
             return {
                 "success": True,
@@ -257,8 +528,8 @@ if __name__ == "__main__":
 
 [License information]
 '''
-            with open(file_path, 'w') as f:
-                f.write(minimal_content)
+            _atomic_write(file_path, minimal_content.encode())
+            _invalidate_file_index()
                 
             return {
                 "success": True,
@@ -284,8 +555,8 @@ if __name__ == "__main__":
                 }
             }
             
-            with open(file_path, 'w') as f:
-                json.dump(minimal_content, f, indent=2)
+            _atomic_write(file_path, orjson.dumps(minimal_content, option=orjson.OPT_INDENT_2))
+            _invalidate_file_index()
                 
             return {
                 "success": True,
@@ -309,30 +580,75 @@ if __name__ == "__main__":
                     "message": f"{missing_module} is a standard library module",
                     "action_required": "Check Python version compatibility"
                 }
+                
+            # Already installed: reinstalling would not fix the import
+            installed = _installed_packages()
+            if missing_module in installed or _normalize_package(missing_module) in installed:
+                return {
+                    "success": True,
+                    "status": "installed",
+                    "message": f"{missing_module} is already installed; the import failed for another reason",
+                    "action_required": "Check the original ImportError for a broken or incompatible installation",
+                    "module": missing_module
+                }
+            
+            # Queue for a batched pip install
+            with self._import_lock:
+                self._pending_imports.add(missing_module)
+                batch_full = len(self._pending_imports) >= IMPORT_BATCH_SIZE
+                if not batch_full and self._import_flush_timer is None:
+                    self._import_flush_timer = threading.Timer(
+                        IMPORT_BATCH_DELAY, self._flush_imports
+                    )
+                    self._import_flush_timer.daemon = True
+                    self._import_flush_timer.start()
+                    
+            if batch_full:
+                self._flush_imports()
+                
+            return {
+                "success": True,
+                "status": "installing",
+                "message": f"Installation of {missing_module} scheduled",
+                "module": missing_module
+            }
+                
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+            
+    def _flush_imports(self):
+        """Installs all queued missing modules with a single pip run."""
+        
+        with self._import_lock:
+            modules = sorted(self._pending_imports)
+            self._pending_imports.clear()
+            if self._import_flush_timer is not None:
+                self._import_flush_timer.cancel()
+                self._import_flush_timer = None
+                
+        if not modules:
+            return None
             
-            # Try pip install
+        try:
             import subprocess
             result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", missing_module],
+                [*self._pip_install, *modules],
                 capture_output=True,
                 text=True
             )
             
             if result.returncode == 0:
-                return {
-                    "success": True,
-                    "message": f"Successfully installed {missing_module}",
-                    "pip_output": result.stdout
-                }
+                installed = _installed_packages()
+                installed.update(modules)
+                installed.update(_normalize_package(module) for module in modules)
+                self.logger.info(f"✅ Successfully installed: {', '.join(modules)}")
             else:
-                return {
-                    "success": False,
-                    "error": f"Failed to install {missing_module}",
-                    "pip_error": result.stderr
-                }
-                
+                self.logger.error(f"Failed to install {', '.join(modules)}: {result.stderr}")
+            return result
+            
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            self.logger.error(f"Failed to install {', '.join(modules)}: {e}")
+            return None
 
     def recover_apm_cycle(self, error_details: Dict[str, Any], context: str) -> Dict[str, Any]:
         """Recovery strategy for interrupted APM cycles."""
@@ -343,8 +659,8 @@ if __name__ == "__main__":
             # Load last known state
             state_file = "apm_framework/last_state.json"
             if os.path.exists(state_file):
-                with open(state_file, 'r') as f:
-                    last_state = json.load(f)
+                with open(state_file, 'rb') as f:
+                    last_state = orjson.loads(f.read())
                     
                 return {
                     "success": True,
@@ -361,9 +677,8 @@ if __name__ == "__main__":
                     "next_phase": "PLAN"
                 }
                 
-                os.makedirs(os.path.dirname(state_file), exist_ok=True)
-                with open(state_file, 'w') as f:
-                    json.dump(new_state, f, indent=2)
+                self._ensure_dir(os.path.dirname(state_file))
+                _atomic_write(state_file, orjson.dumps(new_state, option=orjson.OPT_INDENT_2))
                     
                 return {
                     "success": True,
@@ -397,7 +712,7 @@ if __name__ == "__main__":
                     }
             
             # Create new RAG storage
-            os.makedirs("rag_system/storage", exist_ok=True)
+            self._ensure_dir("rag_system/storage")
             
             return {
                 "success": True,
@@ -441,12 +756,13 @@ if __name__ == "__main__":
             if os.path.exists("requirements.txt"):
                 import subprocess
                 result = subprocess.run(
-                    [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
+                    [*self._pip_install, "-r", "requirements.txt"],
                     capture_output=True,
                     text=True
                 )
                 
                 if result.returncode == 0:
+                    _installed_packages.cache_clear()
                     return {
                         "success": True,
                         "message": "Dependencies installed from requirements.txt",
@@ -462,24 +778,77 @@ if __name__ == "__main__":
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def save_error_documentation(self, error_doc: Dict[str, Any]):
-        """Saves comprehensive error documentation."""
+    def save_error_documentation(self, error_doc: Union[ErrorDoc, Dict[str, Any]]):
+        """
+        Saves comprehensive error documentation.
+        Docs are buffered and written in batches, see _flush.
+        """
         
-        try:
-            os.makedirs("logs/error_docs", exist_ok=True)
+        with self._buffer_lock:
+            self._error_buffer.append(error_doc)
+            batch_full = len(self._error_buffer) >= ERROR_DOC_BATCH_SIZE
+            if not batch_full and self._flush_timer is None:
+                # Bound how long a lone error stays in memory
+                self._flush_timer = threading.Timer(ERROR_DOC_FLUSH_INTERVAL, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+                
+        if batch_full:
+            self._flush()
             
-            filename = f"error_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            filepath = os.path.join("logs/error_docs", filename)
+    def _flush(self):
+        """Writes all buffered error docs to one NDJSON file with a single write."""
+        
+        with self._buffer_lock:
+            batch, self._error_buffer = self._error_buffer, []
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+                
+        if not batch:
+            return
+            
+        try:
+            self._ensure_dir(ERROR_DOC_DIR)
+            filename = f"errors_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.ndjson"
+            filepath = os.path.join(ERROR_DOC_DIR, filename)
+            # Records end in a newline, so joining them yields the NDJSON body
+            payload = b"".join(
+                orjson.dumps(doc, default=str, option=_DOC_JSON_OPTIONS)
+                for doc in batch
+            )
             
-            with open(filepath, 'w') as f:
-                json.dump(error_doc, f, indent=2)
+            with open(filepath, 'wb', buffering=0) as f:
+                f.write(payload)
+                os.fsync(f.fileno())
                 
-            self.logger.info(f"📝 Error documentation saved: {filepath}")
+            self.logger.info(f"📝 Error documentation saved ({len(batch)} errors): {filepath}")
             
         except Exception as e:
+            # The directory may have been removed; re-create it next time
+            self._ensured_dirs.discard(ERROR_DOC_DIR)
             self.logger.error(f"Failed to save error documentation: {e}")
 
 
+def _get_handler() -> SDKErrorHandler:
+    """Returns the process-wide error handler used by safe_execute."""
+    
+    global _HANDLER
+    if _HANDLER is None:
+        with _HANDLER_LOCK:
+            if _HANDLER is None:
+                _HANDLER = SDKErrorHandler()
+    return _HANDLER
+
+
+def _reset_handler():
+    """Drops the shared error handler (for tests)."""
+    
+    global _HANDLER
+    with _HANDLER_LOCK:
+        _HANDLER = None
+
+
 def safe_execute(func, *args, **kwargs):
     """
     Safe execution wrapper with error handling.
@@ -493,13 +862,11 @@ def safe_execute(func, *args, **kwargs):
         Dict containing execution result or error details
     """
     
-    error_handler = SDKErrorHandler()
-    
     try:
         result = func(*args, **kwargs)
         return {"success": True, "result": result}
     except Exception as e:
-        return error_handler.handle_error(
+        error_result = _get_handler().handle_error(
             error_type="execution_error",
             error_details={
                 "function": func.__name__,
@@ -507,4 +874,5 @@ def safe_execute(func, *args, **kwargs):
                 "kwargs": kwargs,
                 "error": str(e)
             }
-        ) 
\ No newline at end of file
+        )
+        return {"success": False, **error_result} 
\ No newline at end of file
@@ -4,31 +4,42 @@ Tests for the Error Handling Framework
 
 import os
 import pytest
-from ..framework import SDKErrorHandler, safe_execute
+from ..framework import SDKErrorHandler, safe_execute, _reset_handler
+
+@pytest.fixture(scope="session")
+def shared_error_handler():
+    """Create one error handler for tests that do not change its state."""
+    return SDKErrorHandler()
 
 @pytest.fixture
 def error_handler():
-    """Create a fresh error handler instance for each test."""
+    """Create a fresh error handler instance for tests that change its state."""
     handler = SDKErrorHandler()
     return handler
 
-def test_error_handler_initialization(error_handler):
+@pytest.fixture(autouse=True)
+def reset_shared_handler():
+    """Give every test its own handler behind safe_execute."""
+    yield
+    _reset_handler()
+
+def test_error_handler_initialization(shared_error_handler):
     """Test basic initialization of error handler."""
-    assert error_handler.error_log_file == "logs/sdk_errors.log"
-    assert isinstance(error_handler.recovery_strategies, dict)
+    assert shared_error_handler.error_log_file == "logs/sdk_errors.log"
+    assert isinstance(shared_error_handler.recovery_strategies, dict)
 
-def test_api_key_recovery(error_handler):
+def test_api_key_recovery(shared_error_handler):
     """Test API key recovery strategy."""
-    result = error_handler.recover_api_keys(
+    result = shared_error_handler.recover_api_keys(
         error_details={"service": "test"},
         context="test"
     )
     assert isinstance(result, dict)
     assert "success" in result
 
-def test_missing_file_recovery(error_handler):
+def test_missing_file_recovery(shared_error_handler):
     """Test missing file recovery strategy."""
-    result = error_handler.recover_missing_files(
+    result = shared_error_handler.recover_missing_files(
         error_details={"file_path": "nonexistent.txt"},
         context="test"
     )
@@ -73,7 +84,7 @@ def test_error_documentation(error_handler, tmp_path):
     # Restore original log file
     error_handler.error_log_file = original_log_file
 
-def test_recovery_strategies_exist(error_handler):
+def test_recovery_strategies_exist(shared_error_handler):
     """Test that all advertised recovery strategies exist."""
     expected_strategies = [
         "api_key_missing",
@@ -87,4 +98,31 @@ def test_recovery_strategies_exist(error_handler):
     ]
     
     for strategy in expected_strategies:
-        assert strategy in error_handler.recovery_strategies 
\ No newline at end of file
+        assert strategy in shared_error_handler.recovery_strategies 
+
+def test_duplicate_errors_deduplicated(error_handler):
+    """Test that repeats of an identical error reuse the first result."""
+    first = error_handler.handle_error("test_duplicate", {"attempt": 1}, "test")
+    second = error_handler.handle_error("test_duplicate", {"attempt": 1}, "test")
+    other = error_handler.handle_error("test_duplicate", {"attempt": 2}, "test")
+    
+    assert second is first
+    assert other is not first
+
+def test_unknown_error_types_aggregated(error_handler):
+    """Test that only the first error of a type without strategy is fully handled."""
+    first = error_handler.handle_error("test_unknown", {"attempt": 1}, "test")
+    second = error_handler.handle_error("test_unknown", {"attempt": 2}, "test")
+    
+    assert first["status"] == "failed"
+    assert second["status"] == "no_strategy"
+    assert "error_doc" in second
+    assert error_handler._unknown_counts["test_unknown"] == 1
+
+def test_custom_recovery_strategy_dispatched(error_handler):
+    """Test that strategies added after initialization are used."""
+    error_handler.recovery_strategies["test_custom"] = lambda details, context: {"success": True}
+    
+    result = error_handler.handle_error("test_custom", {"attempt": 1}, "test")
+    
+    assert result["status"] == "recovered"
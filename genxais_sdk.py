@@ -3,8 +3,8 @@ GENXAIS SDK - Core framework for AI-enhanced software development
 """
 
 import os
-import json
 import logging
+import orjson
 from typing import Dict, List, Any, Callable, Optional, Union
 from pathlib import Path
 
@@ -15,6 +15,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger("GENXAIS")
 
+# Configuration file contents: path -> ((mtime_ns, size), raw bytes). Each
+# framework parses its own copy, so no two share nested sections.
+_CONFIG_CACHE: Dict[str, tuple] = {}
+
+# Last read of ~/.genxais/current_mode.txt, keyed by its (mtime_ns, size)
+_MODE_CACHE: Dict[str, Any] = {"version": None, "value": None}
+
 class GENXAISFramework:
     """Main framework class for GENXAIS"""
     
@@ -56,28 +63,48 @@ class GENXAISFramework:
             return default_config
             
         try:
-            with open(config_path, "r") as f:
-                config = json.load(f)
-                self.logger.info(f"Configuration loaded from {config_path}")
-                return {**default_config, **config}
+            st = os.stat(config_path)
+            version = (st.st_mtime_ns, st.st_size)
+            cached = _CONFIG_CACHE.get(config_path)
+            if cached is not None and cached[0] == version:
+                raw = cached[1]
+            else:
+                raw = Path(config_path).read_bytes()
+                _CONFIG_CACHE[config_path] = (version, raw)
+            config = orjson.loads(raw)
+            self.logger.info(f"Configuration loaded from {config_path}")
+            return {**default_config, **config}
         except Exception as e:
             self.logger.error(f"Error loading configuration: {e}")
             return default_config
             
     def _get_current_mode(self) -> str:
         """Get the current mode from the .genxais directory"""
+        mode = self._read_mode_file()
+        # Default to VAN mode if no (valid) mode is set
+        return mode if mode in self.modes else "VAN"
+        
+    def _read_mode_file(self) -> Optional[str]:
+        """Contents of the mode file, or None if it is missing or unreadable
+        
+        The file is only re-read when its mtime or size changed.
+        """
         mode_file = Path.home() / ".genxais" / "current_mode.txt"
-        if mode_file.exists():
+        try:
+            st = mode_file.stat()
+        except OSError:
+            return None
+            
+        version = (st.st_mtime_ns, st.st_size)
+        if _MODE_CACHE["version"] != version:
             try:
-                with open(mode_file, "r") as f:
-                    mode = f.read().strip()
-                    if mode in self.modes:
-                        return mode
+                mode = mode_file.read_text().strip()
             except Exception as e:
                 self.logger.error(f"Error reading current mode: {e}")
-        
-        # Default to VAN mode if no mode is set
-        return "VAN"
+                return None
+            _MODE_CACHE.update(version=version, value=mode)
+            
+        return _MODE_CACHE["value"]
         
     def set_mode(self, mode: str) -> bool:
         """Set the current mode
@@ -91,6 +118,10 @@ class GENXAISFramework:
         if mode not in self.modes:
             self.logger.error(f"Invalid mode: {mode}")
             return False
+        # Compare with the file, another instance or process may have changed it
+        if mode == self._read_mode_file():
+            self.current_mode = mode
+            return True
             
         try:
             os.makedirs(Path.home() / ".genxais", exist_ok=True)
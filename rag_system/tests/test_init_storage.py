@@ -4,9 +4,11 @@ Tests for RAG storage initialization
 
 import os
 import pytest
+import orjson
 import mongomock
 from datetime import datetime
-from ..init_storage import RAGStorageInitializer
+from bson import ObjectId, json_util
+from ..init_storage import RAGStorageInitializer, _iter_backup_documents, _BACKUP_JSON_OPTIONS
 
 @pytest.fixture
 def storage_initializer():
@@ -135,4 +137,19 @@ def test_connection_error(storage_initializer):
     result = initializer.init_mongodb()
     
     assert result["success"] is False
-    assert result["type"] == "connection_error" 
\ No newline at end of file
+    assert result["type"] == "connection_error" 
+
+def test_iter_backup_documents():
+    """Test decoding backup files document by document."""
+    
+    documents = [
+        {"_id": ObjectId(), "title": "Test", "created_at": datetime(2024, 1, 1, 12, 30)},
+        {"_id": ObjectId(), "doc_id": ObjectId(), "position": 2}
+    ]
+    text = "[" + ",\n".join(
+        orjson.dumps(doc, default=json_util.default, option=_BACKUP_JSON_OPTIONS).decode()
+        for doc in documents
+    ) + "]"
+    
+    assert list(_iter_backup_documents(text)) == documents
+    assert list(_iter_backup_documents(" [ ]\n")) == []
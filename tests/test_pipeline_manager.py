@@ -11,7 +11,7 @@ from typing import Dict, Any
 # Add parent directory to path to import framework
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.pipeline_manager import PipelineManager, PipelineStep
+from core.pipeline_manager import PipelineManager, PipelineStep, PipelineError
 
 # Test pipeline step functions
 async def test_function(context: Dict[str, Any]) -> Dict[str, Any]:
@@ -48,3 +48,126 @@ async def test_pipeline_creation():
     assert pipeline_id in manager.pipelines
     assert manager.pipelines[pipeline_id]["name"] == "test_pipeline"
     assert len(manager.pipelines[pipeline_id]["steps"]) == 1
+
+@pytest.mark.asyncio
+async def test_pipeline_execution():
+    """Test executing a pipeline with dependent steps and error handling"""
+    manager = PipelineManager()
+    
+    pipeline_id = await manager.create_pipeline(
+        "test_pipeline",
+        [
+            PipelineStep(
+                name="step2",
+                function=failing_function,
+                requires=["result"],
+                provides=["output2"],
+                error_handlers=[error_handler],
+                retry_policy={"max_retries": 0}
+            ),
+            PipelineStep(
+                name="step1",
+                function=test_function,
+                requires=["input"],
+                provides=["result"]
+            )
+        ]
+    )
+    
+    state = await manager.execute_pipeline(pipeline_id, {"input": "data"})
+    
+    assert state["result"] == "success"
+    assert state["error_handled"] is True
+    assert manager.pipelines[pipeline_id]["status"] == "completed"
+
+@pytest.mark.asyncio
+async def test_pipeline_cycle_detection():
+    """Test that cyclic step dependencies are rejected"""
+    manager = PipelineManager()
+    
+    with pytest.raises(PipelineError):
+        await manager.create_pipeline(
+            "cyclic_pipeline",
+            [
+                PipelineStep(name="a", function=test_function, requires=["b_out"], provides=["a_out"]),
+                PipelineStep(name="b", function=test_function, requires=["a_out"], provides=["b_out"])
+            ]
+        )
+
+@pytest.mark.asyncio
+async def test_cached_results_scoped_to_pipeline():
+    """Test that cacheable steps with the same name do not share results across pipelines"""
+    manager = PipelineManager()
+    
+    async def load_a(context: Dict[str, Any]) -> Dict[str, Any]:
+        return {"v": "A"}
+    
+    async def load_b(context: Dict[str, Any]) -> Dict[str, Any]:
+        return {"v": "B"}
+    
+    pipeline_a = await manager.create_pipeline(
+        "a", [PipelineStep(name="load", function=load_a, provides=["v"], cacheable=True)]
+    )
+    pipeline_b = await manager.create_pipeline(
+        "b", [PipelineStep(name="load", function=load_b, provides=["v"], cacheable=True)]
+    )
+    
+    assert await manager.execute_pipeline(pipeline_a) == {"v": "A"}
+    assert await manager.execute_pipeline(pipeline_b) == {"v": "B"}
+
+@pytest.mark.asyncio
+async def test_cached_results_not_shared_with_callers():
+    """Test that mutating a returned result does not change the cached result"""
+    manager = PipelineManager()
+    
+    async def load(context: Dict[str, Any]) -> Dict[str, Any]:
+        return {"items": [1, 2]}
+    
+    pipeline_id = await manager.create_pipeline(
+        "mutating_pipeline",
+        [PipelineStep(name="load", function=load, provides=["items"], cacheable=True)]
+    )
+    
+    # The first run stores the result, the second one is served from the cache
+    for _ in range(2):
+        results = await manager.execute_pipeline(pipeline_id)
+        assert results == {"items": [1, 2]}
+        results["items"].append(99)
+    
+    assert await manager.execute_pipeline(pipeline_id) == {"items": [1, 2]}
+
+@pytest.mark.asyncio
+async def test_pipeline_with_bound_method_step():
+    """Test that steps may be methods of objects that cannot be copied"""
+    import threading
+    
+    class Loader:
+        def __init__(self):
+            self.lock = threading.Lock()
+        
+        async def load(self, context: Dict[str, Any]) -> Dict[str, Any]:
+            return {"loaded": True}
+    
+    manager = PipelineManager()
+    pipeline_id = await manager.create_pipeline(
+        "bound_method_pipeline",
+        [PipelineStep(name="load", function=Loader().load, provides=["loaded"])]
+    )
+    
+    assert manager.pipelines[pipeline_id]["steps"][0]["name"] == "load"
+    assert "function" not in manager.pipelines[pipeline_id]["steps"][0]
+
+@pytest.mark.asyncio
+async def test_pipeline_with_async_callable_object():
+    """Test that awaitables returned by non-coroutine callables are awaited"""
+    class AsyncStep:
+        async def __call__(self, context: Dict[str, Any]) -> Dict[str, Any]:
+            return {"called": True}
+    
+    manager = PipelineManager()
+    pipeline_id = await manager.create_pipeline(
+        "callable_pipeline",
+        [PipelineStep(name="call", function=AsyncStep(), provides=["called"])]
+    )
+    
+    assert await manager.execute_pipeline(pipeline_id) == {"called": True}
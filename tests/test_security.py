@@ -4,8 +4,9 @@ Security tests for the GENXAIS Framework
 
 import pytest
 import os
+import time
 import jwt
-from datetime import datetime, timedelta
+import base64
 from unittest.mock import Mock, patch
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives.asymmetric import rsa
@@ -50,10 +51,22 @@ class TestPasswordSecurity:
         """Test password hashing"""
         password = "SecurePass123!"
         hash_str = security_manager.hash_password(password)
-        assert ":" in hash_str
-        salt_hex, key_hex = hash_str.split(":")
-        assert len(bytes.fromhex(salt_hex)) == 16
-        assert len(bytes.fromhex(key_hex)) == 32
+        assert "$" in hash_str
+        salt_b64, key_b64 = hash_str.split("$")
+        assert len(base64.urlsafe_b64decode(salt_b64)) == 16
+        assert len(base64.urlsafe_b64decode(key_b64)) == 32
+        
+    def test_legacy_hex_hash_verification(self, security_manager):
+        """Test verification of hashes in the legacy hex format"""
+        password = "SecurePass123!"
+        salt_b64, key_b64 = security_manager.hash_password(password).split("$")
+        legacy = (
+            base64.urlsafe_b64decode(salt_b64).hex()
+            + ":"
+            + base64.urlsafe_b64decode(key_b64).hex()
+        )
+        assert security_manager.verify_password(password, legacy)
+        assert not security_manager.verify_password("WrongPass123!", legacy)
         
     def test_password_verification(self, security_manager):
         """Test password verification"""
@@ -62,6 +75,14 @@ class TestPasswordSecurity:
         assert security_manager.verify_password(password, hash_str)
         assert not security_manager.verify_password("WrongPass123!", hash_str)
         
+    def test_password_verification_invalid_input(self, security_manager):
+        """Test that malformed hashes and non-str inputs do not verify"""
+        hash_str = security_manager.hash_password("SecurePass123!")
+        assert not security_manager.verify_password(None, hash_str)
+        assert not security_manager.verify_password("SecurePass123!", None)
+        assert not security_manager.verify_password("SecurePass123!", "not-a-hash")
+        assert not security_manager.verify_password("SecurePass123!", "zz:zz")
+        
     def test_password_strength(self, security_manager):
         """Test password strength requirements"""
         assert security_manager.check_password_strength("SecurePass123!")
@@ -84,11 +105,18 @@ class TestTokenManagement:
         """Test token expiration"""
         token = security_manager.generate_token("user123", ["admin"])
         # Fast forward time
-        with patch("datetime.datetime") as mock_datetime:
-            mock_datetime.utcnow.return_value = datetime.utcnow() + timedelta(hours=2)
+        with patch("core.security.time.time", return_value=time.time() + 7200):
             payload = security_manager.validate_token(token)
             assert not payload  # Token should be expired
             
+    def test_cached_claims_not_shared_with_callers(self, security_manager):
+        """Test that mutating validated claims does not change later validations"""
+        token = security_manager.generate_token("user123", ["admin"])
+        for _ in range(2):
+            payload = security_manager.validate_token(token)
+            assert payload["roles"] == ["admin"]
+            payload["roles"].append("root")
+            
     def test_invalid_token(self, security_manager):
         """Test invalid token handling"""
         assert not security_manager.validate_token("invalid.token.here")
@@ -106,19 +134,33 @@ class TestSessionManagement:
         """Test session expiration"""
         token = security_manager.create_session("user123", ["admin"])
         # Fast forward time
-        with patch("datetime.datetime") as mock_datetime:
-            mock_datetime.utcnow.return_value = datetime.utcnow() + timedelta(hours=1)
+        with patch("core.security.time.monotonic", return_value=time.monotonic() + 3600):
             assert not security_manager.validate_session(token)
             
     def test_session_cleanup(self, security_manager):
         """Test session cleanup"""
         token = security_manager.create_session("user123", ["admin"])
         # Fast forward time
-        with patch("datetime.datetime") as mock_datetime:
-            mock_datetime.utcnow.return_value = datetime.utcnow() + timedelta(hours=1)
+        with patch("core.security.time.monotonic", return_value=time.monotonic() + 3600):
             security_manager.cleanup_expired_sessions()
             assert not security_manager.validate_session(token)
             
+    def test_session_cleanup_drains_expiry_heap(self, security_manager):
+        """Test cleanup pops expired and ended sessions from the expiry heap"""
+        expired = security_manager.create_session("user123", ["admin"])
+        ended = security_manager.create_session("user456", ["admin"])
+        assert security_manager.end_session(ended)
+        later = time.monotonic() + 3600
+        with patch("core.security.time.monotonic", return_value=later):
+            active = security_manager.create_session("user789", ["admin"])
+        
+        with patch("core.security.time.monotonic", return_value=later):
+            security_manager.cleanup_expired_sessions()
+            
+        assert expired not in security_manager._session_tokens
+        assert active in security_manager._session_tokens
+        assert [token for _, token in security_manager._session_expiry] == [active]
+            
 class TestLoginSecurity:
     """Test login security features"""
     
@@ -154,6 +196,7 @@ class TestAuditLogging:
             {"critical": True},
             "CRITICAL"
         )
+        security_manager.flush_audit_log()
         # Check log file content
         with open("logs/security_audit.log", "r") as f:
             log_content = f.read()
@@ -186,6 +229,7 @@ class TestKeyRotation:
     def test_key_rotation_logging(self, security_manager):
         """Test key rotation logging"""
         security_manager.rotate_encryption_keys()
+        security_manager.flush_audit_log()
         with open("logs/security_audit.log", "r") as f:
             log_content = f.read()
             assert "key_rotation" in log_content
@@ -222,6 +266,7 @@ class TestSecurityIntegration:
         assert not security_manager.handle_failed_login("target_user")
         
         # 3. Check audit log
+        security_manager.flush_audit_log()
         with open("logs/security_audit.log", "r") as f:
             log_content = f.read()
             assert "account_locked" in log_content